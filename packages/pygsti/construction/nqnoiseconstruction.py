@@ -7,7 +7,12 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 #*****************************************************************
 
 import collections as _collections
+import hashlib as _hashlib
 import itertools as _itertools
+import math as _math
+import operator as _operator
+import os as _os
+import pickle as _pickle
 import numpy as _np
 import scipy as _scipy
 import scipy.sparse as _sps
@@ -43,6 +48,9 @@ from .modelconstruction import basis_build_vector as _basis_build_vector
 
 RANK_TOL = 1e-9
 
+_kcoverage_templates = {}  # cache of get_kcoverage_template results; keys = (n, k) tuples
+_kcoverage_permutations = {}  # cache of the permutations of range(k); keys = k
+
 
 def nparams_XYCNOT_cloudnoise_model(nQubits, geometry="line", maxIdleWeight=1, maxhops=0,
                                     extraWeight1Hops=0, extraGateWeight=0, requireConnected=False,
@@ -1211,6 +1219,20 @@ def test_amped_polys_for_syntheticidle(fidpairs, idleStr, model, prepLbl=None, e
     return rank, Np
 
 
+def _get_new_rowspace_direction(row, basis):
+    """
+    Returns the (normalized) component of the 1-row matrix `row` that is orthogonal to the
+    row space of `basis`, whose rows must be orthonormal, or None when this component's norm
+    is below `RANK_TOL` (i.e. when appending `row` to a matrix whose row space is spanned by
+    `basis` would not increase its rank).
+    """
+    # project twice to keep the basis orthonormal to machine precision
+    residual = row - _np.dot(_np.dot(row, basis.conj().T), basis)
+    residual -= _np.dot(_np.dot(residual, basis.conj().T), basis)
+    residual_norm = _np.linalg.norm(residual)
+    return residual / residual_norm if residual_norm > RANK_TOL else None
+
+
 def find_amped_polys_for_clifford_syntheticidle(qubit_filter, core_filter, trueIdlePairs, idleStr, maxWt,
                                                 model, singleQfiducials=None,
                                                 prepLbl=None, effectLbls=None, initJ=None, initJrank=None,
@@ -1365,6 +1387,14 @@ def find_amped_polys_for_clifford_syntheticidle(qubit_filter, core_filter, trueI
     else:
         J = initJ; Jrank = initJrank
 
+    # Keep an orthonormal basis for the row space of J so that the rank of J with an additional row can be
+    # found by projecting out the existing directions, rather than by recomputing the rank of the whole matrix.
+    if J.shape[0] > 0:
+        _, svals, Vh = _np.linalg.svd(J, full_matrices=False)
+        Jbasis = Vh[svals > RANK_TOL]
+    else:
+        Jbasis = _np.empty((0, Np), 'complex')
+
     # We presume that we know the fiducial pairs
     #  needed to amplify all "true-idle" errors *of the same
     #  type that are on this synthetic idle* (i.e. H+S
@@ -1460,12 +1490,12 @@ def find_amped_polys_for_clifford_syntheticidle(qubit_filter, core_filter, trueI
             Jrow = _np.array([[amped.deriv(iParam).evaluate(dummy) for iParam in _slct.as_array(wrtParams)]])
             if _np.linalg.norm(Jrow) < 1e-8: continue  # row of zeros can fool matrix_rank
 
-            Jtest = _np.concatenate((J, Jrow), axis=0)
-            testRank = _np.linalg.matrix_rank(Jtest, tol=RANK_TOL)
-            #print("find_amped_polys_for_syntheticidle: ",prep,meas,elbl," => rank ",testRank, " (Np=",Np,")")
-            if testRank > Jrank:
-                J = Jtest
-                Jrank = testRank
+            new_direction = _get_new_rowspace_direction(Jrow, Jbasis)
+            #print("find_amped_polys_for_syntheticidle: ",prep,meas,elbl," => new dir ",new_direction is not None)
+            if new_direction is not None:  # Jrow increases the rank of J
+                J = _np.concatenate((J, Jrow), axis=0)
+                Jbasis = _np.concatenate((Jbasis, new_direction), axis=0)
+                Jrank += 1
                 if not added:
                     gatename_fidpair_list = [(prep[i], meas[i]) for i in range(nQubits)]
                     selected_gatename_fidpair_lists.append(gatename_fidpair_list)
@@ -1589,6 +1619,7 @@ def get_fidpairs_needed_to_access_amped_polys(qubit_filter, core_filter, germPow
     Np = _slct.length(wrtParams)
     Namped = amped_polyJ.shape[0]; assert(amped_polyJ.shape[1] == Np)
     J = _np.empty((0, Namped), 'complex'); Jrank = 0
+    Jbasis = _np.empty((0, Namped), 'complex')  # orthonormal basis for the row space of J
 
     #loop over all possible fiducial pairs
     nQubits = len(qubit_filter)
@@ -1668,16 +1699,16 @@ def get_fidpairs_needed_to_access_amped_polys(qubit_filter, core_filter, germPow
                     # (also polynomials - now encoded by a "Jac" row/vec)
                     prow = _np.array([p.deriv(iParam).evaluate(dummy)
                                       for iParam in _slct.as_array(wrtParams)])  # complex
-                    Jrow = _np.array([[_np.vdot(prow, amped_row) for amped_row in amped_polyJ]])  # complex
+                    # Jrow[0,i] = vdot(prow, amped_polyJ[i]) (complex)
+                    Jrow = _np.dot(amped_polyJ, prow.conj()).reshape(1, Namped)
                     if _np.linalg.norm(Jrow) < 1e-8: continue  # row of zeros can fool matrix_rank
 
-                    Jtest = _np.concatenate((J, Jrow), axis=0)
-                    testRank = _np.linalg.matrix_rank(Jtest, tol=RANK_TOL)
-                    if testRank > Jrank:
+                    new_direction = _get_new_rowspace_direction(Jrow, Jbasis)
+                    if new_direction is not None:  # Jrow increases the rank of J
                         #print("ACCESS")
-                        #print("ACCESS: ",prep,meas,testRank, _np.linalg.svd(Jtest, compute_uv=False))
-                        J = Jtest
-                        Jrank = testRank
+                        J = _np.concatenate((J, Jrow), axis=0)
+                        Jbasis = _np.concatenate((Jbasis, new_direction), axis=0)
+                        Jrank += 1
                         if not added:
                             gatename_fidpair_lists.append([(prep[i], meas[i]) for i in range(nQubits)])
                             added = True
@@ -1844,6 +1875,7 @@ def tile_cloud_fidpairs(template_gatename_fidpair_lists, template_germPower, L,
     unused_clouds = list(clouds)
     sequences = []
     germs = []
+    canonical_germs = {}  # so that equal germs are the *same* Circuit object (making later dict lookups cheaper)
 
     while(len(unused_clouds) > 0):
 
@@ -1912,7 +1944,8 @@ def tile_cloud_fidpairs(template_gatename_fidpair_lists, template_germPower, L,
                 merge_into(germStr, germStr_qubits, germ)
                 merge_into(germPowerStr, germPowerStr_qubits, germPower)
 
-            germs.append(_objs.Circuit(germStr, line_labels=qubit_labels))
+            germ = _objs.Circuit(germStr, line_labels=qubit_labels)
+            germs.append(canonical_germs.setdefault(germ, germ))
             sequences.append((_objs.Circuit(prepStr + germPowerStr + measStr, line_labels=qubit_labels), L, germs[-1],
                               _objs.Circuit(prepStr, line_labels=qubit_labels),
                               _objs.Circuit(measStr, line_labels=qubit_labels)))
@@ -2065,7 +2098,7 @@ def get_candidates_for_core(model, core_qubits, candidate_counts, seedStart):
 def create_XYCNOT_cloudnoise_sequences(nQubits, maxLengths, geometry, cnot_edges, maxIdleWeight=1, maxhops=0,
                                        extraWeight1Hops=0, extraGateWeight=0, paramroot="H+S",
                                        sparse=False, verbosity=0, cache=None, idleOnly=False,
-                                       idtPauliDicts=None, algorithm="greedy", comm=None):
+                                       idtPauliDicts=None, algorithm="greedy", comm=None, cache_filename=None):
 
     from pygsti.construction import std1Q_XY  # the base model for 1Q gates
     from pygsti.construction import std2Q_XYICNOT  # the base model for 2Q (CNOT) gate
@@ -2089,7 +2122,7 @@ def create_XYCNOT_cloudnoise_sequences(nQubits, maxLengths, geometry, cnot_edges
                                        gatedict, availability, geometry, maxIdleWeight, maxhops,
                                        extraWeight1Hops, extraGateWeight, paramroot,
                                        sparse, verbosity, cache, idleOnly,
-                                       idtPauliDicts, algorithm, comm=comm)
+                                       idtPauliDicts, algorithm, comm=comm, cache_filename=cache_filename)
 
 
 def create_standard_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
@@ -2097,7 +2130,8 @@ def create_standard_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                                          availability=None, geometry="line",
                                          maxIdleWeight=1, maxhops=0, extraWeight1Hops=0, extraGateWeight=0,
                                          paramroot="H+S", sparse=False, verbosity=0, cache=None, idleOnly=False,
-                                         idtPauliDicts=None, algorithm="greedy", idleOpStr=((),), comm=None):
+                                         idtPauliDicts=None, algorithm="greedy", idleOpStr=((),), comm=None,
+                                         cache_filename=None):
     """
     Create a set of `fiducial1+germ^power+fiducial2` sequences which amplify
     all of the parameters of a `CloudNoiseModel` created by passing the
@@ -2178,6 +2212,17 @@ def create_standard_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         The circuit or label that is used to indicate a completely
         idle layer (all qubits idle).
 
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    cache_filename : str, optional
+        The name of a file used to persist `cache` between Python sessions.
+        If the file exists, cached templates computed for the same gates,
+        fiducials and parameterization are loaded from it (without replacing
+        any entries already in `cache`), and the updated cache is written
+        back to it before returning.
+
     Returns
     -------
     LsGermsSerialStructure
@@ -2201,14 +2246,15 @@ def create_standard_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                                        gatedict, availability, geometry, maxIdleWeight, maxhops,
                                        extraWeight1Hops, extraGateWeight, paramroot,
                                        sparse, verbosity, cache, idleOnly,
-                                       idtPauliDicts, algorithm, idleOpStr, comm)
+                                       idtPauliDicts, algorithm, idleOpStr, comm, cache_filename)
 
 
 def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                                 gatedict, availability, geometry, maxIdleWeight=1, maxhops=0,
                                 extraWeight1Hops=0, extraGateWeight=0, paramroot="H+S",
                                 sparse=False, verbosity=0, cache=None, idleOnly=False,
-                                idtPauliDicts=None, algorithm="greedy", idleOpStr=((),), comm=None):
+                                idtPauliDicts=None, algorithm="greedy", idleOpStr=((),), comm=None,
+                                cache_filename=None):
     """
     Create a set of `fiducial1+germ^power+fiducial2` sequences which amplify
     all of the parameters of a `CloudNoiseModel` created by passing the
@@ -2279,6 +2325,17 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         The circuit or label that is used to indicate a completely
         idle layer (all qubits idle).
 
+    comm : mpi4py.MPI.Comm, optional
+        When not None, an MPI communicator for distributing the computation
+        across multiple processors.
+
+    cache_filename : str, optional
+        The name of a file used to persist `cache` between Python sessions.
+        If the file exists, cached templates computed for the same gates,
+        fiducials and parameterization are loaded from it (without replacing
+        any entries already in `cache`), and the updated cache is written
+        back to it before returning.
+
     Returns
     -------
     LsGermsSerialStructure
@@ -2317,6 +2374,11 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
     if 'Cloud templates' not in cache:
         cache['Cloud templates'] = _collections.defaultdict(list)
 
+    if cache_filename is not None:
+        cache_signature = _get_cloudnoise_cache_signature(singleQfiducials, gatedict, paramroot, sparse,
+                                                          idtPauliDicts, algorithm, idleOpStr)
+        _load_cloudnoise_cache(cache_filename, cache_signature, cache)
+
     ptermstype = paramroot + " terms"
     #the parameterization type used for constructing Models
     # that will be used to construct 1st order prob polynomials.
@@ -2397,30 +2459,28 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
     idle_fidpairs = tile_idle_fidpairs(all_qubit_labels, idle_maxwt_gatename_fidpair_lists, maxIdleWeight)
     printer.log("%d idle pairs found" % len(idle_fidpairs), 2)
 
-    # Create idle sequences by sandwiching Gi^L between all idle fiducial pairs
-    sequences = []
+    # Create idle sequences by sandwiching Gi^L between all idle fiducial pairs.  These
+    # circuits are only built (lazily) when they're needed, i.e. when not idleOnly.
+    def iter_idle_sequences():
+        for L in maxLengths:
+            idle_power = idleOpStr * L  # so Gi^L isn't recomputed for each fiducial pair
+            for prepFid, measFid in idle_fidpairs:
+                yield (prepFid + idle_power + measFid, L, idleOpStr, prepFid, measFid)
+                # circuit, L, germ, prepFidIndex, measFidIndex??
+    nIdleSequences = len(maxLengths) * len(idle_fidpairs)
     selected_germs = [idleOpStr]
-    for L in maxLengths:
-        for fidpair in idle_fidpairs:
-            prepFid, measFid = fidpair
-            sequences.append((prepFid + idleOpStr * L + measFid, L, idleOpStr,
-                              prepFid, measFid))  # was XX
-            # circuit, L, germ, prepFidIndex, measFidIndex??
-    printer.log("%d idle sequences (for all max-lengths: %s)" % (len(sequences), str(maxLengths)))
+    printer.log("%d idle sequences (for all max-lengths: %s)" % (nIdleSequences, str(maxLengths)))
 
     if idleOnly:  # Exit now when we just wanted idle-tomography sequences
         #OLD: return sequences, selected_germs
 
         #Post processing: convert sequence tuples to a operation sequence structure
         Gi_fidpairs = _collections.defaultdict(list)  # lists of fidpairs for each L value
-        for _, L, _, prepFid, measFid in sequences:
-            Gi_fidpairs[L].append((prepFid, measFid))
+        for L in maxLengths:
+            Gi_fidpairs[L].extend(idle_fidpairs)
 
         maxPlaqEls = max([len(fidpairs) for fidpairs in Gi_fidpairs.values()])
-        nMinorRows = nMinorCols = int(_np.floor(_np.sqrt(maxPlaqEls)))
-        if nMinorRows * nMinorCols < maxPlaqEls: nMinorCols += 1
-        if nMinorRows * nMinorCols < maxPlaqEls: nMinorRows += 1
-        assert(nMinorRows * nMinorCols >= maxPlaqEls), "Logic Error!"
+        nMinorRows, nMinorCols = _get_plaquette_dims(maxPlaqEls)
 
         germList = [idleOpStr]
         Ls = sorted(maxLengths)
@@ -2432,6 +2492,8 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
             # returns 'missing_list'; useful if using dsfilter arg
             gss.add_plaquette(germ_power, L, idleOpStr, fidpairs)
 
+        if cache_filename is not None and (comm is None or comm.Get_rank() == 0):
+            _save_cloudnoise_cache(cache_filename, cache_signature, cache)
         return gss
 
     #Compute "true-idle" fidpairs for checking synthetic idle errors for 1 & 2Q gates (HARDCODED OK?)
@@ -2441,24 +2503,52 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         maxSyntheticIdleWt = (gateWt + extraGateWeight) + (gateWt - 1)  # gate-error-wt + spreading potential
         maxSyntheticIdleWt = min(maxSyntheticIdleWt, nQubits)
 
-        if maxSyntheticIdleWt not in cache['Idle gatename fidpair lists']:
-            printer.log("Getting sequences needed for max-weight=%d errors" % maxSyntheticIdleWt)
-            printer.log(" on the idle gate (for %d-Q synthetic idles)" % gateWt)
-            sidle_model = _CloudNoiseModel.build_from_hops_and_weights(
-                maxSyntheticIdleWt, tuple(gatedict.keys()), None, gatedict, {}, None, 'line',
-                maxIdleWeight, 0, maxhops, extraWeight1Hops,
-                extraGateWeight, sparse, verbosity=printer - 5,
-                sim_type="termorder:1", parameterization=ptermstype)
-            sidle_model._clean_paramvec()  # allocates/updates .gpindices of all blocks
-            # these are the params we want to amplify...
-            idle_params = sidle_model.operation_blks['layers']['globalIdle'].gpindices
-
+        if maxSyntheticIdleWt in cache['Idle gatename fidpair lists']:
+            continue
+
+        printer.log("Getting sequences needed for max-weight=%d errors" % maxSyntheticIdleWt)
+        printer.log(" on the idle gate (for %d-Q synthetic idles)" % gateWt)
+        sidle_model = _CloudNoiseModel.build_from_hops_and_weights(
+            maxSyntheticIdleWt, tuple(gatedict.keys()), None, gatedict, {}, None, 'line',
+            maxIdleWeight, 0, maxhops, extraWeight1Hops,
+            extraGateWeight, sparse, verbosity=printer - 5,
+            sim_type="termorder:1", parameterization=ptermstype)
+        sidle_model._clean_paramvec()  # allocates/updates .gpindices of all blocks
+        # these are the params we want to amplify...
+        idle_params = sidle_model.operation_blks['layers']['globalIdle'].gpindices
+        idle_gatename_fidpair_lists = None
+
+        # Fiducial pairs that amplify all the errors of an idle on more than maxSyntheticIdleWt qubits usually
+        # also amplify all of the errors on the first maxSyntheticIdleWt of these qubits (the other qubits are
+        # just idle), so if we already have such pairs, restricting them to these qubits can save a search.  This
+        # isn't guaranteed (the larger idle's errors follow `qubitGraph`, not a line), so check the rank first.
+        larger_wts = [wt for wt in cache['Idle gatename fidpair lists'] if wt > maxSyntheticIdleWt]
+        if len(larger_wts) > 0:
+            restricted_lists = [list(gfp_list) for gfp_list in _lt.remove_duplicates(
+                [tuple(gfp_list[0:maxSyntheticIdleWt])
+                 for gfp_list in cache['Idle gatename fidpair lists'][min(larger_wts)]])]
+            restricted_fidpairs = []
+            for gfp_list in restricted_lists:
+                prepFid = _objs.Circuit(())
+                measFid = _objs.Circuit(())
+                for i, (prep, meas) in enumerate(gfp_list):
+                    prepFid = prepFid + _onqubit(prep, i)
+                    measFid = measFid + _onqubit(meas, i)
+                restricted_fidpairs.append((prepFid, measFid))
+            nAmped, nTotal = test_amped_polys_for_syntheticidle(restricted_fidpairs, idleOpStr, sidle_model,
+                                                                prepLbl, None, wrtParams=idle_params)
+            if nAmped == nTotal:
+                printer.log(" using the cached max-weight=%d sequences (which amplify all %d params)"
+                            % (min(larger_wts), nTotal))
+                idle_gatename_fidpair_lists = restricted_lists
+
+        if idle_gatename_fidpair_lists is None:
             _, _, idle_gatename_fidpair_lists = find_amped_polys_for_syntheticidle(
                 list(range(maxSyntheticIdleWt)), idleOpStr, sidle_model,
                 singleQfiducials, prepLbl, None, wrtParams=idle_params,
                 algorithm=algorithm, comm=comm, verbosity=printer - 1)
             #idle_gatename_fidpair_lists = [] # DEBUG GRAPH ISO
-            cache['Idle gatename fidpair lists'][maxSyntheticIdleWt] = idle_gatename_fidpair_lists
+        cache['Idle gatename fidpair lists'][maxSyntheticIdleWt] = idle_gatename_fidpair_lists
 
     #Look for and add additional germs to amplify the *rest* of the model's parameters
     Gi_nparams = model.operation_blks['layers']['globalIdle'].num_params()  # assumes nqnoise (Implicit) model
@@ -2470,6 +2560,49 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
 
     printer.log("Beginning search for non-idle germs & fiducial pairs")
 
+    # The same germs are queried for their repetition counts (one per max-length) many times below - when
+    # checking L-value support, when finding fiducial pairs, and when tiling - so compute these just once per germ.
+    germ_reps_cache = {}
+
+    def get_germ_reps(germ):
+        """ Returns a list of `(L, reps)` tuples giving the number of times `germ` is repeated for each L """
+        if germ not in germ_reps_cache:
+            germ_reps_cache[germ] = [(L, _gsc.repeat_count_with_max_length(germ, L)) for L in maxLengths]
+        return germ_reps_cache[germ]
+
+    # Whether a germ's access cache (see cache structure below) supports all the L-values is checked for every
+    # germ of every cloud, so we encode sets of "effective germ reps" as integer bitmasks (bit k set <=> k is in
+    # the set) and the check becomes a single AND of the germ's required mask with its access cache's mask.
+    # Access caches are held in `cache` for this entire function, so their ids are valid keys.
+    required_reps_masks = {}  # keys = (germ, germ_order) tuples
+    access_cache_masks = {}  # keys = id(access_cache)
+
+    def get_required_reps_mask(germ, germ_order):
+        """ Returns a bitmask of the effective germ reps needed to support all the L-values """
+        if (germ, germ_order) not in required_reps_masks:
+            mask = 0
+            for L, reps in get_germ_reps(germ):
+                mask |= 1 << (reps % germ_order)
+            required_reps_masks[(germ, germ_order)] = mask
+        return required_reps_masks[(germ, germ_order)]
+
+    def get_access_cache_mask(access_cache):
+        """ Returns a bitmask of the effective germ reps present in `access_cache` """
+        if id(access_cache) not in access_cache_masks:  # e.g. an access cache loaded from a user-supplied cache
+            access_cache_masks[id(access_cache)] = sum([1 << effective_reps for effective_reps in access_cache])
+        return access_cache_masks[id(access_cache)]
+
+    def set_access_fidpairs(access_cache, effective_reps, gatename_fidpair_lists):
+        """ Adds `gatename_fidpair_lists` to `access_cache`, keeping its bitmask up to date """
+        mask = get_access_cache_mask(access_cache)
+        access_cache[effective_reps] = gatename_fidpair_lists
+        access_cache_masks[id(access_cache)] = mask | (1 << effective_reps)
+
+    def supports_all_Ls(germ, germ_order, access_cache):
+        """ Whether `access_cache` holds fiducial pairs for all the effective germ reps needed by `germ` """
+        required_mask = get_required_reps_mask(germ, germ_order)
+        return (get_access_cache_mask(access_cache) & required_mask) == required_mask
+
     # Cloudbanks are lists of "equivalent" clouds, such that the same template
     # can be applied to all of them given a qubit mapping.  Elements of
     # `cloudbanks` are dicts with keys "template" and "clouds":
@@ -2478,8 +2611,22 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
     #   - "clouds" is a list of (cloud_dict, template->cloud map) tuples specifying
     #      how to map the template's sequences onto the cloud (of *actual* qubits)
     cloudbanks = _collections.OrderedDict()
+
+    # The global idle's params and the (non-global) primitive gates - grouped by the set of qubits they act
+    # on - are the same for every cloud, so gather them once here rather than once per cloud below.
+    # OK b/c model.num_params() called above
+    Gi_params = set(_slct.as_array(model.operation_blks['layers']['globalIdle'].gpindices))
+    primitive_op_labels_by_sslbls = _collections.defaultdict(list)
+    for gl in model.get_primitive_op_labels():  # take this as the set of "base"/"serial" operations
+        if gl.sslbls is None: continue  # gates that act on everything (usually just the identity Gi gate)
+        primitive_op_labels_by_sslbls[frozenset(gl.sslbls)].append(gl)
+
+    # Note: clouds are processed serially on purpose.  A cloud that matches an existing template reuses (and may
+    # extend) the germs and fiducial pairs found for earlier clouds, and the polynomial-evaluation points are
+    # drawn from numpy's global RNG, so both the work done and the sequences chosen depend on cloud order.
     for icloud, (core_qubits, cloud_qubits) in enumerate(clouds):
         cloud_dict = {'core': core_qubits, 'qubits': cloud_qubits}  # just for clarity, label the pieces
+        cloud_qubit_pos = {ql: i for i, ql in enumerate(cloud_qubits)}  # index of each qubit label in cloud_qubits
 
         # Collect "pure gate" params of gates that *exactly* on (just and only) the core_qubits;
         # these are the parameters we want this cloud to amplify.  If all the gates which act on
@@ -2490,14 +2637,9 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         # This is fine, but we don't demand that such params be amplified, since they *must* be
         # amplified for another cloud with core exaclty equal to the gate's target qubits (e.g. [0])
         wrtParams = set()
-        # OK b/c model.num_params() called above
-        Gi_params = set(_slct.as_array(model.operation_blks['layers']['globalIdle'].gpindices))
-        pure_op_labels = []
-        for gl in model.get_primitive_op_labels():  # take this as the set of "base"/"serial" operations
-            if gl.sslbls is None: continue  # gates that act on everything (usually just the identity Gi gate)
-            if set(gl.sslbls) == set(core_qubits):
-                pure_op_labels.append(gl)
-                wrtParams.update(_slct.as_array(model.operation_blks['cloudnoise'][gl].gpindices))
+        pure_op_labels = primitive_op_labels_by_sslbls.get(frozenset(core_qubits), [])
+        for gl in pure_op_labels:
+            wrtParams.update(_slct.as_array(model.operation_blks['cloudnoise'][gl].gpindices))
         pure_op_params = wrtParams - Gi_params  # (Gi params don't count)
         wrtParams = _slct.list_to_slice(sorted(list(pure_op_params)), array_ok=True)
         Ngp = _slct.length(wrtParams)  # number of "pure gate" params that we want to amplify
@@ -2524,73 +2666,73 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
             """ Get the cache key we use for a cloud """
             return (len(cloud['qubits']), len(cloud['core']), maxhops, extraWeight1Hops, extraGateWeight)
 
-        def map_cloud_template(cloud, oplabels, graph, template):
+        def get_cloud_adjacency(cloud, cloud_edges, cloud_pos, directed):
+            """
+            Encode the cloud's edges as bits: bit j of the returned list's i-th element is set
+            when there's an edge from the i-th to the j-th cloud qubit (as indexed by `cloud_pos`).
+            """
+            adj = [0] * len(cloud['qubits'])
+            for ql1, ql2 in cloud_edges:
+                adj[cloud_pos[ql1]] |= 1 << cloud_pos[ql2]
+                if not directed: adj[cloud_pos[ql2]] |= 1 << cloud_pos[ql1]
+            return adj
+
+        def map_cloud_template(cloud, oplabels, core_edges, cloud_edges, cloud_pos, adj, template):
             """ Attempt to map `cloud` onto the cloud template `template`"""
             template_glabels, template_graph, _ = template
             #Note: number of total & core qubits should be the same,
             # since cloud is in the same "class" as template
             nCore = len(cloud['core'])
             nQubits = len(cloud['qubits'])
-            template_core_graph = template_graph.subgraph(list(range(nCore)))
-            template_cloud_graph = template_graph.subgraph(list(range(nQubits)))
-            core_graph = graph.subgraph(cloud['core'])
-            cloud_graph = graph.subgraph(cloud['qubits'])
+            template_core_edges = template_graph.subgraph(list(range(nCore))).edges()
+            template_cloud_edges = template_graph.subgraph(list(range(nQubits))).edges()
 
             #Make sure each has the same number of operation labels
             if len(template_glabels) != len(oplabels):
                 return None
 
+            # Since a template->cloud map is 1-1, it maps the template's edges onto the cloud's edges
+            # exactly when there are the same number of each and every mapped template edge is present.
+            def edges_map_exactly(template_edges, cloud_edges, template_to_pos):
+                """ Whether `template_to_pos` (template index -> cloud index) maps template_edges onto cloud_edges """
+                if len(template_edges) != len(cloud_edges): return False
+                return all((adj[template_to_pos[t1]] >> template_to_pos[t2]) & 1 for t1, t2 in template_edges)
+
             # Try to match core qubit labels (via oplabels & graph)
             for possible_perm in _itertools.permutations(cloud['core']):
                 # possible_perm is a permutation of cloud's core labels, e.g. ('Q1','Q0','Q2')
                 # such that the ordering gives the mapping from template index/labels 0 to nCore-1
                 possible_template_to_cloud_map = {i: ql for i, ql in enumerate(possible_perm)}
+                core_pos = [cloud_pos[ql] for ql in possible_perm]
+
+                if edges_map_exactly(template_core_edges, core_edges, core_pos):  # a match so far!
 
-                gr = core_graph.copy()
-                for template_edge in template_core_graph.edges():
-                    edge = (possible_template_to_cloud_map[template_edge[0]],
-                            possible_template_to_cloud_map[template_edge[1]])
-                    if gr.has_edge(edge):  # works w/directed & undirected graphs
-                        gr.remove_edge(edge[0], edge[1])
+                    #Now test operation labels
+                    for template_gl in template_glabels:
+                        gl = template_gl.map_state_space_labels(possible_template_to_cloud_map)
+                        if gl not in oplabels:
+                            break
                     else:
-                        break  # missing edge -> possible_perm no good
-                else:  # no missing templage edges!
-                    if len(gr.edges()) == 0:  # and all edges were present - a match so far!
-
-                        #Now test operation labels
-                        for template_gl in template_glabels:
-                            gl = template_gl.map_state_space_labels(possible_template_to_cloud_map)
-                            if gl not in oplabels:
-                                break
-                        else:
-                            #All oplabels match (oplabels can't have extra b/c we know length are the same)
-                            core_map = possible_template_to_cloud_map
-
-                            # Try to match non-core qubit labels (via graph)
-                            non_core_qubits = [ql for ql in cloud['qubits'] if (ql not in cloud['core'])]
-                            for possible_perm in _itertools.permutations(non_core_qubits):
-                                # possible_perm is a permutation of cloud's non-core labels, e.g. ('Q4','Q3')
-                                # such that the ordering gives the mapping from template index/labels nCore to nQubits-1
-                                possible_template_to_cloud_map = core_map.copy()
-                                possible_template_to_cloud_map.update(
-                                    {i: ql for i, ql in enumerate(possible_perm, start=nCore)})
-                                # now possible_template_to_cloud_map maps *all* of the qubits
-
-                                gr = cloud_graph.copy()
-                                for template_edge in template_cloud_graph.edges():
-                                    edge = (possible_template_to_cloud_map[template_edge[0]],
-                                            possible_template_to_cloud_map[template_edge[1]])
-                                    if gr.has_edge(edge):  # works w/directed & undirected graphs
-                                        gr.remove_edge(edge[0], edge[1])
-                                    else:
-                                        break  # missing edge -> possible_perm no good
-                                else:  # no missing templage edges!
-                                    if len(gr.edges()) == 0:  # and all edges were present - a match!!!
-                                        return possible_template_to_cloud_map
+                        #All oplabels match (oplabels can't have extra b/c we know length are the same)
+                        core_map = possible_template_to_cloud_map
+
+                        # Try to match non-core qubit labels (via graph)
+                        non_core_qubits = [ql for ql in cloud['qubits'] if (ql not in cloud['core'])]
+                        for possible_perm in _itertools.permutations(non_core_qubits):
+                            # possible_perm is a permutation of cloud's non-core labels, e.g. ('Q4','Q3')
+                            # such that the ordering gives the mapping from template index/labels nCore to nQubits-1
+                            possible_template_to_cloud_map = core_map.copy()
+                            possible_template_to_cloud_map.update(
+                                {i: ql for i, ql in enumerate(possible_perm, start=nCore)})
+                            # now possible_template_to_cloud_map maps *all* of the qubits
+
+                            if edges_map_exactly(template_cloud_edges, cloud_edges,
+                                                 core_pos + [cloud_pos[ql] for ql in possible_perm]):
+                                return possible_template_to_cloud_map  # all edges are present - a match!!!
 
             return None
 
-        def create_cloud_template(cloud, pure_op_labels, graph):
+        def create_cloud_template(cloud, pure_op_labels, cloud_edges, directed):
             """ Creates a new cloud template, currently a (template_glabels, template_graph, germ_dict) tuple """
             nQubits = len(cloud['qubits'])
             cloud_to_template_map = {ql: i for i, ql in enumerate(
@@ -2603,29 +2745,35 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
             template_glabels = [gl.map_state_space_labels(cloud_to_template_map)
                                 for gl in pure_op_labels]
             template_edges = []
-            cloud_graph = graph.subgraph(cloud['qubits'])
-            for edge in cloud_graph.edges():
+            for edge in cloud_edges:
                 template_edges.append((cloud_to_template_map[edge[0]],
                                        cloud_to_template_map[edge[1]]))
 
             template_graph = _objs.QubitGraph(list(range(nQubits)),
                                               initial_edges=template_edges,
-                                              directed=graph.directed)
+                                              directed=directed)
             cloud_template = (template_glabels, template_graph, {})
             template_to_cloud_map = {t: c for c, t in cloud_to_template_map.items()}
             return cloud_template, template_to_cloud_map
 
+        # The cloud's (core and full) edges are the same for every template we try, so only get them once
+        core_edges = qubitGraph.subgraph(core_qubits).edges()
+        cloud_edges = qubitGraph.subgraph(cloud_qubits).edges()
+        cloud_adj = get_cloud_adjacency(cloud_dict, cloud_edges, cloud_qubit_pos, qubitGraph.directed)
+
         cloud_class_key = get_cloud_key(cloud_dict, maxhops, extraWeight1Hops, extraGateWeight)
         cloud_class_templates = cache['Cloud templates'][cloud_class_key]
         for cloud_template in cloud_class_templates:
-            template_to_cloud_map = map_cloud_template(cloud_dict, pure_op_labels, qubitGraph, cloud_template)
+            template_to_cloud_map = map_cloud_template(cloud_dict, pure_op_labels, core_edges, cloud_edges,
+                                                       cloud_qubit_pos, cloud_adj, cloud_template)
             if template_to_cloud_map is not None:  # a cloud template is found!
                 template_glabels, template_graph, _ = cloud_template
                 printer.log("Found cached template for this cloud: %d qubits, gates: %s, map: %s" %
                             (len(cloud_qubits), template_glabels, template_to_cloud_map), 2)
                 break
         else:
-            cloud_template, template_to_cloud_map = create_cloud_template(cloud_dict, pure_op_labels, qubitGraph)
+            cloud_template, template_to_cloud_map = create_cloud_template(cloud_dict, pure_op_labels, cloud_edges,
+                                                                          qubitGraph.directed)
             cloud_class_templates.append(cloud_template)
             printer.log("Created a new template for this cloud: %d qubits, gates: %s, map: %s" %
                         (len(cloud_qubits), cloud_template[0], template_to_cloud_map), 2)
@@ -2646,10 +2794,8 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         cloud_to_template_map = {c: t for t, c in template_to_cloud_map.items()}
         germ_dict = cloud_template[2]  # see above structure
         if len(germ_dict) > 0:  # germ_dict should always be non-None
-            allLsExist = all([all([
-                ((_gsc.repeat_count_with_max_length(germ, L) % germ_order) in access_cache)
-                for L in maxLengths])
-                for germ, (germ_order, access_cache) in germ_dict.items()])
+            allLsExist = all([supports_all_Ls(germ, germ_order, access_cache)
+                              for germ, (germ_order, access_cache) in germ_dict.items()])
         else: allLsExist = False
 
         if len(germ_dict) == 0 or not allLsExist:
@@ -2674,8 +2820,7 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                 #Check if we need any new L-value support for this germ
                 if template_germ in germ_dict:
                     germ_order, access_cache = germ_dict[template_germ]
-                    if all([((_gsc.repeat_count_with_max_length(template_germ, L) % germ_order)
-                             in access_cache) for L in maxLengths]):
+                    if supports_all_Ls(template_germ, germ_order, access_cache):
                         continue  # move on to the next germ
 
                 #Let's see if we want to add this germ
@@ -2706,7 +2851,7 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                     if template_germ not in germ_dict:
                         germ_dict[template_germ] = (sireps, {})  # germ_order, access_cache
                     access_fidpairs_cache = germ_dict[template_germ][1]  # see above structure
-                    access_fidpairs_cache[0] = sidle_gatename_fidpair_lists  # idle: effective_reps == 0
+                    set_access_fidpairs(access_fidpairs_cache, 0, sidle_gatename_fidpair_lists)  # idle: effreps == 0
 
                     amped_polyJ = J[-nNewAmpedDirs:, :]  # just the rows of the Jacobian corresponding to
                     # the directions we want the current germ to amplify
@@ -2714,8 +2859,7 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                     #print("DB: amped_polyJ svals = ",_np.linalg.svd(amped_polyJ, compute_uv=False))
 
                     #Figure out which fiducial pairs access the amplified directions at each value of L
-                    for L in maxLengths:
-                        reps = _gsc.repeat_count_with_max_length(candidate_germ, L)
+                    for L, reps in get_germ_reps(candidate_germ):
                         if reps == 0: continue  # don't process when we don't use the germ at all...
                         effective_reps = reps % sireps
                         germPower = candidate_germ * effective_reps  # germ^effective_reps
@@ -2733,13 +2877,13 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                             template_gatename_fidpair_lists = []
                             for gatename_fidpair_list in gatename_fidpair_lists:
                                 template_gatename_fidpair_lists.append([
-                                    gatename_fidpair_list[cloud_qubits.index(template_to_cloud_map[tl])]
+                                    gatename_fidpair_list[cloud_qubit_pos[template_to_cloud_map[tl]]]
                                     for tl in range(len(cloud_qubits))])  # tl ~= "Q0" is *label* of a template qubit
                             #E.G if template qubit labels are [0,1,2] , cloud_qubits = [Q3,Q4,Q2] and map is 0->Q4,
                             # 1->Q2, 2->Q3 then we need to know what *index* Q4,Q2,Q3 are with the template, i.e the
                             # index of template_to_cloud[0], template_to_cloud[1], ... in cloud_qubits
 
-                            access_fidpairs_cache[effective_reps] = gatename_fidpair_lists
+                            set_access_fidpairs(access_fidpairs_cache, effective_reps, gatename_fidpair_lists)
                         else:
                             printer.log("Already found fiducial pairs needed to amplify %s^%d (L=%d, effreps=%d)" %
                                         (candidate_germ.str, reps, L, effective_reps), 4)
@@ -2757,6 +2901,8 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
         else:
             printer.log("Fiducials for all L-values are cached!", 3)
 
+    tiled_sequences = [iter_idle_sequences()]  # sequence lists & iterators, joined once after all cloudbanks are tiled
+    nSequences = nIdleSequences
     for icb, cloudbank in enumerate(cloudbanks.values()):
         template_glabels, template_graph, germ_dict = cloudbank['template']
 
@@ -2771,8 +2917,7 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
 
             printer.log("Tiling for template germ = %s" % template_germ.str, 3)
             add_germs = True
-            for L in maxLengths:
-                reps = _gsc.repeat_count_with_max_length(template_germ, L)
+            for L, reps in get_germ_reps(template_germ):
                 if reps == 0: continue  # don't process when we don't use the germ at all...
                 effective_reps = reps % germ_order
                 template_gatename_fidpair_lists = access_cache[effective_reps]
@@ -2782,14 +2927,16 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
                                                             template_germPower, L, template_germ,
                                                             cloudbank['clouds'], all_qubit_labels)
 
-                sequences.extend(addl_seqs)
+                tiled_sequences.append(addl_seqs)
+                nSequences += len(addl_seqs)
                 if add_germs:  # addl_germs is independent of L - so just add once
                     selected_germs.extend(addl_germs)
                     add_germs = False
 
                 printer.log("After tiling L=%d to cloudbank, have %d sequences, %d germs" %
-                            (L, len(sequences), len(selected_germs)), 4)
+                            (L, nSequences, len(selected_germs)), 4)
 
+    sequences = list(_itertools.chain.from_iterable(tiled_sequences))
     printer.log("Done: %d sequences, %d germs" % (len(sequences), len(selected_germs)))
     #OLD: return sequences, selected_germs
     #sequences : list
@@ -2801,20 +2948,16 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
     #    `sequences`.
 
     #Post processing: convert sequence tuples to a operation sequence structure
+    # (group fiducial pairs by germ and then L in a single pass, hashing each germ only once per sequence)
     Ls = set()
     germs = _collections.OrderedDict()
 
     for opstr, L, germ, prepFid, measFid in sequences:
         Ls.add(L)
-        if germ not in germs: germs[germ] = {}
-        if L not in germs[germ]: germs[germ][L] = []
-        germs[germ][L].append((prepFid, measFid))
+        germs.setdefault(germ, {}).setdefault(L, []).append((prepFid, measFid))
 
     maxPlaqEls = max([len(fidpairs) for gdict in germs.values() for fidpairs in gdict.values()])
-    nMinorRows = nMinorCols = int(_np.floor(_np.sqrt(maxPlaqEls)))
-    if nMinorRows * nMinorCols < maxPlaqEls: nMinorCols += 1
-    if nMinorRows * nMinorCols < maxPlaqEls: nMinorRows += 1
-    assert(nMinorRows * nMinorCols >= maxPlaqEls), "Logic Error!"
+    nMinorRows, nMinorCols = _get_plaquette_dims(maxPlaqEls)
 
     germList = list(germs.keys())  # ordered dict so retains nice ordering
     Ls = sorted(list(Ls))
@@ -2827,22 +2970,248 @@ def create_cloudnoise_sequences(nQubits, maxLengths, singleQfiducials,
             germ_power = _gsc.repeat_with_max_length(serial_germ, L)
             gss.add_plaquette(germ_power, L, germ, fidpairs)  # returns 'missing_list'; useful if using dsfilter arg
 
+    if cache_filename is not None and (comm is None or comm.Get_rank() == 0):
+        _save_cloudnoise_cache(cache_filename, cache_signature, cache)
     return gss
 
 
+def _get_plaquette_dims(maxPlaqEls):
+    """
+    Returns the `(nMinorRows, nMinorCols)` of the smallest near-square grid (with
+    rows <= cols <= rows + 1) that holds `maxPlaqEls` plaquette elements.
+    """
+    nMinorRows = nMinorCols = _isqrt(maxPlaqEls)
+    if nMinorRows * nMinorCols < maxPlaqEls: nMinorCols += 1
+    if nMinorRows * nMinorCols < maxPlaqEls: nMinorRows += 1
+    assert(nMinorRows * nMinorCols >= maxPlaqEls), "Logic Error!"
+    return nMinorRows, nMinorCols
+
+
+def _isqrt(n):
+    """ The integer square root of `n`, i.e. the largest integer whose square is <= `n` """
+    r = int(_math.sqrt(n))  # may be off by one for very large n due to floating point rounding
+    while r * r > n: r -= 1
+    while (r + 1) * (r + 1) <= n: r += 1
+    return r
+
+
+def _get_cloudnoise_cache_signature(singleQfiducials, gatedict, paramroot, sparse, idtPauliDicts, algorithm, idleOpStr):
+    """
+    Returns a string identifying the arguments of :function:`create_cloudnoise_sequences`
+    that its `cache` implicitly depends on (the cache's keys hold everything else).  Unlike
+    `hash`, this string is the same in every Python session, so it can be saved to disk.
+    """
+    M = _hashlib.md5()
+    M.update(repr((paramroot, bool(sparse), algorithm, str(idleOpStr),
+                   [tuple(fid) for fid in singleQfiducials],
+                   None if (idtPauliDicts is None) else [sorted(d.items()) for d in idtPauliDicts])).encode('utf-8'))
+    for gatename, gate in gatedict.items():
+        M.update(repr(gatename).encode('utf-8'))
+        if isinstance(gate, _np.ndarray) or hasattr(gate, 'todense'):
+            mx = gate if isinstance(gate, _np.ndarray) else gate.todense()
+            M.update(_np.ascontiguousarray(mx, 'complex').tobytes())
+        else:
+            M.update(str(gate).encode('utf-8'))
+    return M.hexdigest()
+
+
+def _load_cloudnoise_cache(filename, signature, cache):
+    """
+    Adds the entries of the cache saved in `filename` by :function:`_save_cloudnoise_cache`
+    to `cache`, provided the file exists and was saved with the same `signature`.  Entries
+    already present in `cache` are kept.
+    """
+    if not _os.path.exists(filename): return
+    with open(filename, 'rb') as f:
+        saved = _pickle.load(f)
+    if saved.get('signature', None) != signature:
+        _warnings.warn(("Ignoring cloud-noise sequence cache in %s because it was created for different"
+                        " gates, fiducials, or parameterization") % filename)
+        return
+    for cache_key in ('Idle gatename fidpair lists', 'Cloud templates'):
+        for k, v in saved['cache'].get(cache_key, {}).items():
+            if k not in cache[cache_key]: cache[cache_key][k] = v
+
+
+def _save_cloudnoise_cache(filename, signature, cache):
+    """ Saves `cache` (along with its `signature`) to `filename` """
+    with open(filename, 'wb') as f:
+        _pickle.dump({'signature': signature, 'cache': cache}, f)
+
+
 def _get_kcoverage_template_k2(n):
     """ Special case where k == 2 -> use hypercube construction """
     # k = 2 implies binary strings of 0's and 1's
-    def bitstr(nQubits, bit):
-        """ Returns a length-nQubits list of the values of the bit-th bit in the integers 0->nQubits"""
-        return [((i >> bit) & 1) for i in range(nQubits)]
+    nBits = (n - 1).bit_length()  # == ceil(log2(n)), the number of bits needed to distinguish n integers
+    half = (_np.arange(n)[None, :] >> _np.arange(nBits)[:, None]) & 1  # half[b, i] = b-th bit of integer i
+    return _np.concatenate((half, 1 - half), axis=0).tolist()  # second half = inverted bits
 
-    def invert(bstr):
-        return [(0 if x else 1) for x in bstr]
 
-    half = [bitstr(n, k) for k in range(int(_np.ceil(_np.math.log(n, 2))))]
-    other_half = [invert(bstr) for bstr in half]
-    return half + other_half
+def _get_kcoverage_permutations(k):
+    """ Returns a list of all the permutations (tuples) of the integers 0 to `k-1` """
+    if k not in _kcoverage_permutations:
+        _kcoverage_permutations[k] = list(_itertools.permutations(range(k), k))
+    return _kcoverage_permutations[k]
+
+
+def _add_kcoverage_column(cols, nRows, a, k, verbosity):
+    """
+    Add the `a`-th column to the partial k-coverage template `cols` (a list of
+    `a` columns, each a list of `nRows` integers), adding rows as needed.
+
+    Returns the new number of rows.
+    """
+    if verbosity > 1: print(" - Adding column %d: currently %d rows" % (a, nRows))
+
+    #We know that columns 0..(a-1) satisfy the property that
+    # the values of any k of them contain every permutation
+    # of the integers 0..(k-1) (perhaps multiple times).  It is
+    # then also true that the values of any (k-1) columns take
+    # on each Perm(k,k-1) - i.e. the length-(k-1) permutations of
+    # the first k integers.
+    #
+    # So at this point we consider all combinations of k columns
+    # that include the a-th one (so really just combinations of
+    # k-1 existing colums), and fill in the a-th column values
+    # so that the k-columns take on each permuations of k integers.
+    #
+
+    # the new column, kept as two parallel lists: the values, with None sentinels in all (currently open) rows,
+    # and the "alternate rows" each assigned value could equally well have been placed in.  Sets of rows, like
+    # the alternate rows and the open rows, are integer bitmasks (bit m set <=> row m is in the set).
+    col_a = [None] * nRows
+    alts_a = [None] * nRows
+    open_rows = (1 << nRows) - 1
+
+    # added heuristic step for increased efficiency:
+    # preference each open element of the a-th column by taking the
+    # "majority vote" among what the existing column values "want"
+    # the a-th column to be.
+    pref_a = []
+    votes = [0] * k  # votes[v] = number of votes for value v (reused for each row)
+    existing_cols_list = list(_itertools.combinations(range(a), k - 1))  # the same for every row
+    sum_of_vals = k * (k - 1) // 2  # sum of the values (0 to k-1) the k-1 existing + a-th columns need to take
+    for m in range(nRows):
+        for v in range(k): votes[v] = 0
+        voted = []  # the values in the order they first get a vote (ties go to the earliest)
+        row = [col[m] for col in cols]
+        for existing_cols in existing_cols_list:
+            existing_vals = set([row[i] for i in existing_cols])
+            if len(existing_vals) < k - 1: continue  # if our chosen existing cols don't
+            # even cover all but one val then don't cast a vote
+            val = sum_of_vals - sum(existing_vals)  # the *only* value not in existing_vals
+            if votes[val] == 0: voted.append(val)
+            votes[val] += 1
+
+        majority = None; majority_cnt = 0
+        for val in voted:
+            if votes[val] > majority_cnt:
+                majority, majority_cnt = val, votes[val]
+        pref_a.append(majority)
+
+    for existing_cols in _itertools.combinations(range(a - 1, -1, -1), k - 1):  # reverse-range(a) == heuristic
+        if verbosity > 2: print("  - check perms are present for cols %s" % str(existing_cols + (a,)))
+
+        # Which rows match a desired_row on existing_cols only depends on the first k-1 elements of desired_row,
+        # so group the rows by their values on existing_cols once (and add new rows to their group below).
+        # The groups are kept both as lists and as bitmasks, as both are needed for each desired_row.
+        matching_rows_by_vals = {}
+        matching_masks_by_vals = _collections.defaultdict(int)
+        existing_vals = zip(*[cols[i] for i in existing_cols]) if existing_cols else [()] * nRows  # k == 1 case
+        for m, vals in enumerate(existing_vals):
+            matching_rows_by_vals.setdefault(vals, []).append(m)
+            matching_masks_by_vals[vals] |= 1 << m
+
+        #make sure cols existing_cols + [a] take on all the needed permutations
+        # Since existing_cols already takes on all permuations minus the last
+        # value (which is determined as it's the only one missing from the k-1
+        # existing cols) - we just need to *complete* each existing row and possibly
+        # duplicate + add rows to ensure all completions exist.
+        for desired_row in _get_kcoverage_permutations(k):
+
+            matching_rows = matching_rows_by_vals.get(desired_row[0:k - 1], [])  # rows that match on existing_cols
+            matching_mask = matching_masks_by_vals[desired_row[0:k - 1]]
+
+            if verbosity > 3: print("   - perm %s: %d rows, %d match perm, %d open"
+                                    % (str(desired_row), nRows, len(matching_rows), bin(open_rows).count('1')))
+            v = desired_row[k - 1]  # the value to place (with alternate rows == matching_rows)
+            placed = False
+
+            #Best: find a row that already has the value we're looking for (set via previous iteration)
+            for m in matching_rows:
+                if col_a[m] == v:
+                    # a perfect match! - no need to take an open slot
+                    if verbosity > 3: print("    -> existing row (index %d) perfectly matches!" % m)
+                    alts_a[m] &= matching_mask; placed = True; break
+            if placed: continue
+
+            #Better: find an open row that prefers the value we want to place in it
+            for m in matching_rows:
+                # slot is open & prefers the value we want to place in it - take it!
+                if col_a[m] is None and pref_a[m] == v:
+                    if verbosity > 3: print("    -> open preffered row (index %d) matches!" % m)
+                    col_a[m] = v; alts_a[m] = matching_mask; open_rows &= ~(1 << m); placed = True; break
+            if placed: continue
+
+            #Good: find any open row (FUTURE: maybe try to shift for preference first?)
+            for m in matching_rows:
+                if col_a[m] is None:  # slot is open - take it!
+                    if verbosity > 3: print("    -> open row (index %d) matches!" % m)
+                    col_a[m] = v; alts_a[m] = matching_mask; open_rows &= ~(1 << m); placed = True; break
+            if placed: continue
+
+            # no open slots
+            # option1: (if there are any open rows)
+            #  Look to swap an existing value in a matching row
+            #   to an open row allowing us to complete the matching
+            #   row using the current desired_row.
+            shift_soln_found = False
+            if open_rows:
+                for m in matching_rows:
+                    # can assume col_a[m] is *not* None given above logic
+                    ist = open_rows & alts_a[m]
+                    if ist:
+                        # just get the first element, as set.pop() orders it; the rows are added to the set
+                        # in increasing order, as they were when alts_a held lists of rows, so templates don't change
+                        m2 = set(i for i in range(ist.bit_length()) if (ist >> i) & 1).pop()
+                        # move value in row m to m2, then put v into the now-open m-th row
+                        col_a[m2], alts_a[m2] = col_a[m], alts_a[m]
+                        col_a[m], alts_a[m] = v, matching_mask
+                        open_rows &= ~(1 << m2)
+                        if verbosity > 3: print("    -> row %d >> row %d, and row %d matches!" % (m, m2, m))
+                        shift_soln_found = True
+                        break
+
+            if not shift_soln_found:
+                # no shifting can be performed to place v into an open row,
+                # so we just create a new row equal to desired_row on existing_cols.
+                # How do we choose the non-(existing & last) colums? For now, just
+                # replicate the first element of matching_rows:
+                if verbosity > 3: print("    -> creating NEW row.")
+                for i in range(a):
+                    cols[i].append(cols[i][matching_rows[0]])
+                col_a.append(v)
+                alts_a.append(matching_mask)
+                matching_rows.append(nRows)  # (matching_rows is the list in matching_rows_by_vals)
+                matching_masks_by_vals[desired_row[0:k - 1]] |= 1 << nRows
+                nRows += 1
+
+    #Check for any remaining open rows that we never needed to use.
+    # (the a-th column can then be anything we want, so as heuristic
+    #  choose a least-common value in the row already)
+    for m in range(nRows):
+        if col_a[m] is None:
+            cnts = {v: 0 for v in range(k)}  # count of each possible value
+            for i in range(a): cnts[cols[i][m]] += 1
+            val = 0; mincnt = cnts[0]
+            for v, cnt in cnts.items():  # get value with minimal count
+                if cnt < mincnt:
+                    val = v; mincnt = cnt
+            col_a[m] = val
+
+    # a-th column is complete (we no longer need the alternate rows)
+    cols.append(col_a)
+    return nRows
 
 
 def get_kcoverage_template(n, k, verbosity=0):
@@ -2883,161 +3252,30 @@ def get_kcoverage_template(n, k, verbosity=0):
     #indices run 0->(k-1)
     assert(n >= k), "Total number of qubits must be >= k"
 
-    if k == 2:
-        return _get_kcoverage_template_k2(n)
+    # templates are deterministic and (for larger n and k) costly to build, so only build each one once
+    if (n, k) not in _kcoverage_templates:
+        if k == 2:
+            rows = _get_kcoverage_template_k2(n)
+        else:
+            rows = _build_kcoverage_template(n, k, verbosity)
+        _kcoverage_templates[(n, k)] = tuple([tuple(row) for row in rows])
+    return [list(row) for row in _kcoverage_templates[(n, k)]]
+
 
+def _build_kcoverage_template(n, k, verbosity):
+    """ Builds the k-coverage template returned by :function:`get_kcoverage_template` when k > 2 """
     #first k cols -> k! permutations of the k indices:
-    cols = [list() for i in range(k)]
-    for row in _itertools.permutations(range(k), k):
-        for i in range(k):
-            cols[i].append(row[i])
+    cols = [list(col) for col in zip(*_get_kcoverage_permutations(k))]
     nRows = len(cols[0])
     if verbosity > 0: print("get_template(n=%d,k=%d):" % (n, k))
 
     # Now add cols k to n-1:
     for a in range(k, n):  # a is index of column we're adding
-        if verbosity > 1: print(" - Adding column %d: currently %d rows" % (a, nRows))
-
-        #We know that columns 0..(a-1) satisfy the property that
-        # the values of any k of them contain every permutation
-        # of the integers 0..(k-1) (perhaps multiple times).  It is
-        # then also true that the values of any (k-1) columns take
-        # on each Perm(k,k-1) - i.e. the length-(k-1) permutations of
-        # the first k integers.
-        #
-        # So at this point we consider all combinations of k columns
-        # that include the a-th one (so really just combinations of
-        # k-1 existing colums), and fill in the a-th column values
-        # so that the k-columns take on each permuations of k integers.
-        #
-
-        col_a = [None] * nRows  # the new column - start with None sentinels in all current rows
-
-        # added heuristic step for increased efficiency:
-        # preference each open element of the a-th column by taking the
-        # "majority vote" among what the existing column values "want"
-        # the a-th column to be.
-        pref_a = []
-        for m in range(nRows):
-            votes = _collections.defaultdict(lambda: 0)
-            for existing_cols in _itertools.combinations(range(a), k - 1):
-                vals = set(range(k))  # the values the k-1 existing + a-th columns need to take
-                vals = vals - set([cols[i][m] for i in existing_cols])
-                if len(vals) > 1: continue  # if our chosen existing cols don't
-                # even cover all but one val then don't cast a vote
-                assert(len(vals) == 1)
-                val = vals.pop()  # pops the *only* element
-                votes[val] += 1
-
-            majority = None; majority_cnt = 0
-            for ky, val in votes.items():
-                if val > majority_cnt:
-                    majority, majority_cnt = ky, val
-            pref_a.append(majority)
-
-        for existing_cols in _itertools.combinations(range(a - 1, -1, -1), k - 1):  # reverse-range(a) == heuristic
-            if verbosity > 2: print("  - check perms are present for cols %s" % str(existing_cols + (a,)))
-
-            #make sure cols existing_cols + [a] take on all the needed permutations
-            # Since existing_cols already takes on all permuations minus the last
-            # value (which is determined as it's the only one missing from the k-1
-            # existing cols) - we just need to *complete* each existing row and possibly
-            # duplicate + add rows to ensure all completions exist.
-            for desired_row in _itertools.permutations(range(k), k):
-
-                matching_rows = []  # rows that match desired_row on existing_cols
-                open_rows = []  # rows with a-th column open (unassigned)
-
-                for m in range(nRows):
-                    if all([cols[existing_cols[i]][m] == desired_row[i] for i in range(k - 1)]):
-                        # m-th row matches desired_row on existing_cols
-                        matching_rows.append(m)
-                    if col_a[m] is None:
-                        open_rows.append(m)
-
-                if verbosity > 3: print("   - perm %s: %d rows, %d match perm, %d open"
-                                        % (str(desired_row), nRows, len(matching_rows), len(open_rows)))
-                v = {'value': desired_row[k - 1], 'alternate_rows': matching_rows}
-                placed = False
-
-                #Best: find a row that already has the value we're looking for (set via previous iteration)
-                for m in matching_rows:
-                    if col_a[m] and col_a[m]['value'] == desired_row[k - 1]:
-                        # a perfect match! - no need to take an open slot
-                        updated_alts = [i for i in col_a[m]['alternate_rows'] if i in matching_rows]
-                        if verbosity > 3: print("    -> existing row (index %d) perfectly matches!" % m)
-                        col_a[m]['alternate_rows'] = updated_alts; placed = True; break
-                if placed: continue
-
-                #Better: find an open row that prefers the value we want to place in it
-                for m in matching_rows:
-                    # slot is open & prefers the value we want to place in it - take it!
-                    if col_a[m] is None and pref_a[m] == desired_row[k - 1]:
-                        if verbosity > 3: print("    -> open preffered row (index %d) matches!" % m)
-                        col_a[m] = v; placed = True; break
-                if placed: continue
-
-                #Good: find any open row (FUTURE: maybe try to shift for preference first?)
-                for m in matching_rows:
-                    if col_a[m] is None:  # slot is open - take it!
-                        if verbosity > 3: print("    -> open row (index %d) matches!" % m)
-                        col_a[m] = v; placed = True; break
-                if placed: continue
-
-                # no open slots
-                # option1: (if there are any open rows)
-                #  Look to swap an existing value in a matching row
-                #   to an open row allowing us to complete the matching
-                #   row using the current desired_row.
-                open_rows = set(open_rows)  # b/c use intersection below
-                shift_soln_found = False
-                if len(open_rows) > 0:
-                    for m in matching_rows:
-                        # can assume col_a[m] is *not* None given above logic
-                        ist = open_rows.intersection(col_a[m]['alternate_rows'])
-                        if len(ist) > 0:
-                            m2 = ist.pop()  # just get the first element
-                            # move value in row m to m2, then put v into the now-open m-th row
-                            col_a[m2] = col_a[m]
-                            col_a[m] = v
-                            if verbosity > 3: print("    -> row %d >> row %d, and row %d matches!" % (m, m2, m))
-                            shift_soln_found = True
-                            break
-
-                if not shift_soln_found:
-                    # no shifting can be performed to place v into an open row,
-                    # so we just create a new row equal to desired_row on existing_cols.
-                    # How do we choose the non-(existing & last) colums? For now, just
-                    # replicate the first element of matching_rows:
-                    if verbosity > 3: print("    -> creating NEW row.")
-                    for i in range(a):
-                        cols[i].append(cols[i][matching_rows[0]])
-                    col_a.append(v)
-                    nRows += 1
-
-        #Check for any remaining open rows that we never needed to use.
-        # (the a-th column can then be anything we want, so as heuristic
-        #  choose a least-common value in the row already)
-        for m in range(nRows):
-            if col_a[m] is None:
-                cnts = {v: 0 for v in range(k)}  # count of each possible value
-                for i in range(a): cnts[cols[i][m]] += 1
-                val = 0; mincnt = cnts[0]
-                for v, cnt in cnts.items():  # get value with minimal count
-                    if cnt < mincnt:
-                        val = v; mincnt = cnt
-                col_a[m] = {'value': val, 'alternate_rows': "N/A"}
-
-        # a-th column is complete; "cement" it by replacing
-        # value/alternative_rows dicts with just the values
-        col_a = [d['value'] for d in col_a]
-        cols.append(col_a)
+        nRows = _add_kcoverage_column(cols, nRows, a, k, verbosity)
 
     #convert cols to "strings" (rows)
     assert(len(cols) == n)
-    rows = []
-    for i in range(len(cols[0])):
-        rows.append([cols[j][i] for j in range(n)])
+    rows = [list(row) for row in zip(*cols)]
 
     if verbosity > 0: print(" Done: %d rows total" % len(rows))
     return rows
@@ -3062,17 +3300,27 @@ def check_kcoverage_template(rows, n, k, verbosity=0):
     """
     if verbosity > 0: print("check_template(n=%d,k=%d)" % (n, k))
 
+    rows = _np.array(rows, 'i')
+    perms = _np.array(_get_kcoverage_permutations(k), 'i')
+
+    # encode length-k words (e.g. a row's values on k columns) as base-k integers,
+    # so checking for a permutation is checking for an integer code
+    place_values = k**_np.arange(k)
+    perm_codes = _np.dot(perms, place_values)
+    rows = _np.where((rows >= 0) & (rows < k), rows, -k**k)  # out-of-range values => negative codes (no match)
+
     #for each set of k qubits (of the total n qubits)
     for cols_to_check in _itertools.combinations(range(n), k):
         if verbosity > 1: print(" - checking cols %s" % str(cols_to_check))
-        for perm in _itertools.permutations(range(k), k):
-            for m, row in enumerate(rows):
-                if all([row[i] == perm[i] for i in range(k)]):
-                    if verbosity > 2: print("  - perm %s: found at row %d" % (str(perm), m))
-                    break
-            else:
-                assert(False), \
-                    "Permutation %s on qubits (cols) %s is not present!" % (str(perm), str(cols_to_check))
+        codes = _np.dot(rows[:, list(cols_to_check)], place_values)  # codes[m] encodes row m on cols_to_check
+        present = _np.in1d(perm_codes, codes)
+        if verbosity > 2:
+            for perm, perm_code in zip(perms[present], perm_codes[present]):
+                print("  - perm %s: found at row %d" % (str(tuple(perm)), _np.argmax(codes == perm_code)))
+        if not _np.all(present):
+            perm = tuple(perms[_np.argmin(present)])
+            assert(False), \
+                "Permutation %s on qubits (cols) %s is not present!" % (str(perm), str(cols_to_check))
     if verbosity > 0: print(" check succeeded!")
 
 
@@ -3122,12 +3370,20 @@ def filter_nqubit_sequences(sequence_tuples, sectors_to_keep,
     filtered_sequence_tuples : list
         A list of tuples with the same structure as `sequence tuples`.
     """
+    # Germs and fiducials are shared by many sequence tuples, so filter each distinct one only once
+    filtered_cache = {}
+
+    def filter_repeated_circuit(circuit):
+        if circuit not in filtered_cache:
+            filtered_cache[circuit] = _gsc.filter_circuit(circuit, sectors_to_keep, new_sectors, idle)
+        return filtered_cache[circuit]
+
     ret = []
     for opstr, L, germ, prepfid, measfid in sequence_tuples:
-        new_germ = _gsc.filter_circuit(germ, sectors_to_keep, new_sectors, idle)
+        new_germ = filter_repeated_circuit(germ)
         if len(new_germ) > 0 or len(opstr) == 0:
-            new_prep = _gsc.filter_circuit(prepfid, sectors_to_keep, new_sectors, idle)
-            new_meas = _gsc.filter_circuit(measfid, sectors_to_keep, new_sectors, idle)
+            new_prep = filter_repeated_circuit(prepfid)
+            new_meas = filter_repeated_circuit(measfid)
             new_gstr = _gsc.filter_circuit(opstr, sectors_to_keep, new_sectors, idle)
             ret.append((new_gstr, L, new_germ, new_prep, new_meas))
 
@@ -3206,22 +3462,21 @@ def fidpairs_to_gatename_fidpair_list(fidpairs, nQubits):
         `(prep_names, meas_names)` tuples, on per qubit.  `prep_names` and
         `meas_names` are tuples of single-qubit gate *names* (strings).
     """
+    get_name_and_sslbls = _operator.attrgetter('name', 'sslbls')
     gatename_fidpair_list = []
     for fidpair in fidpairs:
         gatenames_per_qubit = [(list(), list()) for i in range(nQubits)]  # prepnames, measnames for each qubit
         prepStr, measStr = fidpair
 
         for lbl in prepStr:
-            assert(len(lbl.sslbls) == 1), "Can only convert strings with solely 1Q gates"
-            gatename = lbl.name
-            iQubit = lbl.sslbls[0]
-            gatenames_per_qubit[iQubit][0].append(gatename)
+            gatename, sslbls = get_name_and_sslbls(lbl)
+            assert(len(sslbls) == 1), "Can only convert strings with solely 1Q gates"
+            gatenames_per_qubit[sslbls[0]][0].append(gatename)
 
         for lbl in measStr:
-            assert(len(lbl.sslbls) == 1), "Can only convert strings with solely 1Q gates"
-            gatename = lbl.name
-            iQubit = lbl.sslbls[0]
-            gatenames_per_qubit[iQubit][1].append(gatename)
+            gatename, sslbls = get_name_and_sslbls(lbl)
+            assert(len(sslbls) == 1), "Can only convert strings with solely 1Q gates"
+            gatenames_per_qubit[sslbls[0]][1].append(gatename)
 
         #Convert lists -> tuples
         gatenames_per_qubit = tuple([(tuple(x[0]), tuple(x[1])) for x in gatenames_per_qubit])
@@ -3278,6 +3533,10 @@ def stdmodule_to_smqmodule(std_module):
     std_module_name_parts[-1] = std_module_name_parts[-1].replace('std', 'smq')
     new_module_name = '.'.join(std_module_name_parts)
 
+    # Modules created below are registered in sys.modules, so this memoizes the conversion
+    if new_module_name in _sys.modules:
+        return _sys.modules[new_module_name]
+
     try:
         return importlib.import_module(new_module_name)
     except ImportError:
@@ -3329,18 +3588,16 @@ def stdmodule_to_smqmodule(std_module):
     new_target_model._evotype = std_target_model._evotype
     new_target_model._default_gauge_group = std_target_model._default_gauge_group
 
-    for lbl, obj in std_target_model.preps.items():
-        new_lbl = find_replace_labels.get(lbl, lbl)
-        new_target_model.preps[new_lbl] = obj.copy()
-    for lbl, obj in std_target_model.povms.items():
-        new_lbl = find_replace_labels.get(lbl, lbl)
-        new_target_model.povms[new_lbl] = obj.copy()
-    for lbl, obj in std_target_model.operations.items():
-        new_lbl = find_replace_labels.get(lbl, lbl)
-        new_target_model.operations[new_lbl] = obj.copy()
-    for lbl, obj in std_target_model.instruments.items():
-        new_lbl = find_replace_labels.get(lbl, lbl)
-        new_target_model.instruments[new_lbl] = obj.copy()
+    def copy_relabeled(src_dict, dest_dict):
+        """ Copy the members of `src_dict` into `dest_dict`, updating their labels """
+        get_new_lbl = find_replace_labels.get
+        for lbl, obj in src_dict.items():
+            dest_dict[get_new_lbl(lbl, lbl)] = obj.copy()  # (item assignment so members are linked to the model)
+
+    copy_relabeled(std_target_model.preps, new_target_model.preps)
+    copy_relabeled(std_target_model.povms, new_target_model.povms)
+    copy_relabeled(std_target_model.operations, new_target_model.operations)
+    copy_relabeled(std_target_model.instruments, new_target_model.instruments)
     out_module['_target_model'] = new_target_model
 
     # _stdtarget and _gscache need to be *locals* as well so target_model(...) works
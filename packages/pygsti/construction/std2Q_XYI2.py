@@ -26,12 +26,9 @@ germs = _strc.circuit_list([('Gii',), ('Gix',), ('Giy',), ('Gix', 'Giy'),
                             ('Gix', 'Gix', 'Gii', 'Giy'), ('Gix', 'Giy', 'Giy', 'Gii'),
                             ('Gix', 'Gix', 'Giy', 'Gix', 'Giy', 'Giy')])
 
-#Construct a target model: Identity, X(pi/2), Y(pi/2)
-_target_model = _setc.build_explicit_model([('Q0',)], ['Gii', 'Gix', 'Giy'],
-                                           ["I(Q0)", "X(pi/2,Q0)", "Y(pi/2,Q0)"],
-                                           effectLabels=['0', '1'], effectExpressions=["0", "1"])
-
-_gscache = {("full", "auto"): _target_model}
+#The target model (Identity, X(pi/2), Y(pi/2)) is only constructed when it's first needed (see target_model)
+_target_model = None
+_gscache = {}
 
 
 def target_model(parameterization_type="full", sim_type="auto"):
@@ -52,35 +49,43 @@ def target_model(parameterization_type="full", sim_type="auto"):
     -------
     Model
     """
+    global _target_model
+    if _target_model is None:
+        _target_model = _setc.build_explicit_model([('Q0',)], ['Gii', 'Gix', 'Giy'],
+                                                   ["I(Q0)", "X(pi/2,Q0)", "Y(pi/2,Q0)"],
+                                                   effectLabels=['0', '1'], effectExpressions=["0", "1"])
+        _gscache[("full", "auto")] = _target_model
+
     return _stdtarget._copy_target(_sys.modules[__name__], parameterization_type,
                                    sim_type, _gscache)
 
 
-clifford_compilation = _OrderedDict()
-clifford_compilation['Gc0c0'] = ['Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c1'] = ['Giy', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c2'] = ['Gix', 'Gix', 'Gix', 'Giy', 'Giy', 'Giy', 'Gii']
-clifford_compilation['Gc0c3'] = ['Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c4'] = ['Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gix', 'Gii']
-clifford_compilation['Gc0c5'] = ['Gix', 'Giy', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c6'] = ['Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c7'] = ['Giy', 'Giy', 'Giy', 'Gix', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c8'] = ['Gix', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c9'] = ['Gix', 'Gix', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c10'] = ['Giy', 'Gix', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c11'] = ['Gix', 'Gix', 'Gix', 'Giy', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c12'] = ['Giy', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c13'] = ['Gix', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c14'] = ['Gix', 'Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gix']
-clifford_compilation['Gc0c15'] = ['Giy', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c16'] = ['Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c17'] = ['Gix', 'Giy', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c18'] = ['Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gii', 'Gii']
-clifford_compilation['Gc0c19'] = ['Gix', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c20'] = ['Gix', 'Giy', 'Giy', 'Giy', 'Gix', 'Gii', 'Gii']
-clifford_compilation['Gc0c21'] = ['Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii']
-clifford_compilation['Gc0c22'] = ['Gix', 'Gix', 'Gix', 'Giy', 'Giy', 'Gii', 'Gii']
-clifford_compilation['Gc0c23'] = ['Gix', 'Giy', 'Gix', 'Gix', 'Gix', 'Gii', 'Gii']
+clifford_compilation = _OrderedDict([
+    ('Gc0c0', ('Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c1', ('Giy', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c2', ('Gix', 'Gix', 'Gix', 'Giy', 'Giy', 'Giy', 'Gii')),
+    ('Gc0c3', ('Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c4', ('Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gix', 'Gii')),
+    ('Gc0c5', ('Gix', 'Giy', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c6', ('Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c7', ('Giy', 'Giy', 'Giy', 'Gix', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c8', ('Gix', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c9', ('Gix', 'Gix', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c10', ('Giy', 'Gix', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c11', ('Gix', 'Gix', 'Gix', 'Giy', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c12', ('Giy', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c13', ('Gix', 'Gix', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c14', ('Gix', 'Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gix')),
+    ('Gc0c15', ('Giy', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c16', ('Gix', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c17', ('Gix', 'Giy', 'Gix', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c18', ('Giy', 'Giy', 'Giy', 'Gix', 'Gix', 'Gii', 'Gii')),
+    ('Gc0c19', ('Gix', 'Giy', 'Giy', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c20', ('Gix', 'Giy', 'Giy', 'Giy', 'Gix', 'Gii', 'Gii')),
+    ('Gc0c21', ('Giy', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii', 'Gii')),
+    ('Gc0c22', ('Gix', 'Gix', 'Gix', 'Giy', 'Giy', 'Gii', 'Gii')),
+    ('Gc0c23', ('Gix', 'Giy', 'Gix', 'Gix', 'Gix', 'Gii', 'Gii')),
+])
 
 
 global_fidPairs = [
@@ -279,13 +279,9 @@ legacy_germs = _strc.circuit_list(
      ])
 
 
-#Construct the target model
-_target_model = _setc.build_explicit_model(
-    [('Q0', 'Q1')], ['Gii', 'Gix', 'Giy', 'Gxi', 'Gyi', 'Gcnot'],
-    ["I(Q0):I(Q1)", "I(Q0):X(pi/2,Q1)", "I(Q0):Y(pi/2,Q1)", "X(pi/2,Q0):I(Q1)", "Y(pi/2,Q0):I(Q1)", "CNOT(Q0,Q1)"],
-    effectLabels=['00', '01', '10', '11'], effectExpressions=["0", "1", "2", "3"])
-
-_gscache = {("full", "auto"): _target_model}
+#The target model is constructed on the first call to target_model()
+_target_model = None
+_gscache = {}
 
 
 def target_model(parameterization_type="full", sim_type="auto"):
@@ -306,6 +302,15 @@ def target_model(parameterization_type="full", sim_type="auto"):
     -------
     Model
     """
+    global _target_model
+    if _target_model is None:
+        _target_model = _setc.build_explicit_model(
+            [('Q0', 'Q1')], ['Gii', 'Gix', 'Giy', 'Gxi', 'Gyi', 'Gcnot'],
+            ["I(Q0):I(Q1)", "I(Q0):X(pi/2,Q1)", "I(Q0):Y(pi/2,Q1)", "X(pi/2,Q0):I(Q1)",
+             "Y(pi/2,Q0):I(Q1)", "CNOT(Q0,Q1)"],
+            effectLabels=['00', '01', '10', '11'], effectExpressions=["0", "1", "2", "3"])
+        _gscache[("full", "auto")] = _target_model
+
     return _stdtarget._copy_target(_sys.modules[__name__], parameterization_type,
                                    sim_type, _gscache)
 
@@ -5,12 +5,16 @@ import numpy as _np
 import itertools as _itertools
 
 from ... import objects as _objs
-from ... import tools as _tools
 from ...construction import nqnoiseconstruction as _nqn
 
 from . import pauliobjs as _pobjs
 # maybe need to restructure in future - "tools" usually doesn't import "objects"
 
+#Caches of the (deterministic) lists built below, as tuples so they can't be modified
+_allerrors_cache = {}  # keys are (N, maxweight)
+_allobservables_cache = {}  # keys are (measurement basis string, maxweight)
+_nontrivial_paulis_cache = {}  # keys are weights
+
 
 def alloutcomes(prep, meas, maxweight):
     """
@@ -35,12 +39,14 @@ def alloutcomes(prep, meas, maxweight):
     #whether '0' or '1' outcome is expected, i.e. what is an "error"
 
     N = len(prep)  # == len(meas)
-    eoutcome = _pobjs.NQOutcome(''.join(expected))
-    if maxweight == 1:
-        return [eoutcome.flip(i) for i in range(N)]
-    else:
-        return [eoutcome.flip(i) for i in range(N)] + \
-               [eoutcome.flip(i, j) for i in range(N) for j in range(i + 1, N)]
+    e = ''.join(expected)
+    f = ''.join(["1" if x == "0" else "0" for x in expected])  # all bits of `e` flipped
+    #Splice flipped bits into the expected string directly (same as NQOutcome(e).flip(...))
+    outcomes = [_pobjs.NQOutcome(e[:i] + f[i] + e[i + 1:]) for i in range(N)]
+    if maxweight == 2:
+        outcomes += [_pobjs.NQOutcome(e[:i] + f[i] + e[i + 1:j] + f[j] + e[j + 1:])
+                     for i in range(N) for j in range(i + 1, N)]
+    return outcomes
 
 
 def allerrors(N, maxweight):
@@ -57,13 +63,14 @@ def allerrors(N, maxweight):
         A list of :class:`NQPauliOp` objects.
     """
     if not (0 < maxweight <= 2): raise NotImplementedError("Only maxweigth <= 2 is currently supported")
-    if maxweight == 1:
-        return [_pobjs.NQPauliOp.Weight1Pauli(N, loc, p) for loc in range(N) for p in range(3)]
-    else:
-        return [_pobjs.NQPauliOp.Weight1Pauli(N, loc, p) for loc in range(N) for p in range(3)] + \
-               [_pobjs.NQPauliOp.Weight2Pauli(N, loc1, loc2, p1, p2) for loc1 in range(N)
-                for loc2 in range(loc1 + 1, N)
-                for p1 in range(3) for p2 in range(3)]
+    if (N, maxweight) not in _allerrors_cache:
+        errors = [_pobjs.NQPauliOp.Weight1Pauli(N, loc, p) for loc in range(N) for p in range(3)]
+        if maxweight == 2:
+            errors += [_pobjs.NQPauliOp.Weight2Pauli(N, loc1, loc2, p1, p2) for loc1 in range(N)
+                       for loc2 in range(loc1 + 1, N)
+                       for p1 in range(3) for p2 in range(3)]
+        _allerrors_cache[(N, maxweight)] = tuple(errors)
+    return list(_allerrors_cache[(N, maxweight)])
 
 
 def allobservables(meas, maxweight):
@@ -86,11 +93,14 @@ def allobservables(meas, maxweight):
     #Note: returned observables always have '+' sign (i.e. .sign == +1).  We're
     # not interested in meas.signs - this is take into account when we compute the
     # expectation value of our observable given a prep & measurement fiducial.
-    if maxweight == 1:
-        return [_pobjs.NQPauliOp(meas.rep).subpauli([i]) for i in range(len(meas))]
-    else:
-        return [_pobjs.NQPauliOp(meas.rep).subpauli([i]) for i in range(len(meas))] + \
-               [_pobjs.NQPauliOp(meas.rep).subpauli([i, j]) for i in range(len(meas)) for j in range(i + 1, len(meas))]
+    key = (''.join(meas.rep), maxweight)  # meas.rep may be a list of 1-qubit Paulis
+    if key not in _allobservables_cache:
+        observables = [_pobjs.NQPauliOp(meas.rep).subpauli([i]) for i in range(len(meas))]
+        if maxweight == 2:
+            observables += [_pobjs.NQPauliOp(meas.rep).subpauli([i, j])
+                            for i in range(len(meas)) for j in range(i + 1, len(meas))]
+        _allobservables_cache[key] = tuple(observables)
+    return list(_allobservables_cache[key])
 
 
 def tile_pauli_fidpairs(base_fidpairs, nQubits, maxweight):
@@ -120,18 +130,24 @@ def tile_pauli_fidpairs(base_fidpairs, nQubits, maxweight):
         qubits).
     """
     nqubit_fidpairs = []
+    added = set()  # (prep rep, prep signs, meas rep, meas signs) tuples of the pairs in nqubit_fidpairs
     tmpl = _nqn.get_kcoverage_template(nQubits, maxweight)
     for base_prep, base_meas in base_fidpairs:
         for tmpl_row in tmpl:
             #Replace 0...weight-1 integers in tmpl_row with Pauli basis
             # designations (e.g. +X) to construct NQPauliState objects.
-            prep = _pobjs.NQPauliState([base_prep.rep[i] for i in tmpl_row],
-                                       [base_prep.signs[i] for i in tmpl_row])
-            meas = _pobjs.NQPauliState([base_meas.rep[i] for i in tmpl_row],
-                                       [base_meas.signs[i] for i in tmpl_row])
-            nqubit_fidpairs.append((prep, meas))
+            prep_rep = [base_prep.rep[i] for i in tmpl_row]
+            prep_signs = [base_prep.signs[i] for i in tmpl_row]
+            meas_rep = [base_meas.rep[i] for i in tmpl_row]
+            meas_signs = [base_meas.signs[i] for i in tmpl_row]
+
+            #Only construct pairs that aren't duplicates of ones we already have
+            key = (tuple(prep_rep), tuple(prep_signs), tuple(meas_rep), tuple(meas_signs))
+            if key in added: continue
+            added.add(key)
+            nqubit_fidpairs.append((_pobjs.NQPauliState(prep_rep, prep_signs),
+                                    _pobjs.NQPauliState(meas_rep, meas_signs)))
 
-    _tools.remove_duplicates_in_place(nqubit_fidpairs)
     return nqubit_fidpairs
 
 
@@ -152,10 +168,63 @@ def nontrivial_paulis(wt):
     list
         A list of tuples of 'X', 'Y', and 'Z', e.g. `('X','Z')`.
     """
-    ret = []
-    for tup in _itertools.product(*([['X', 'Y', 'Z']] * wt)):
-        ret.append(tup)
-    return ret
+    if wt not in _nontrivial_paulis_cache:
+        _nontrivial_paulis_cache[wt] = tuple(_itertools.product(('X', 'Y', 'Z'), repeat=wt))
+    return list(_nontrivial_paulis_cache[wt])
+
+
+def _idle_factor_params(nQubits, model):
+    """
+    Gets the Pauli labels and parameter indices of the error terms of each
+    factor of the global idle operation within `model`.
+
+    The global idle of a :class:`CloudNoiseModel` is a composition of embedded
+    gates, each acting on a set of 1 to max-error-weight qubits and having a
+    Hamiltonian, stochastic, and (possibly) affine error generator coefficient
+    for each nontrivial Pauli on these qubits.
+
+    Parameters
+    ----------
+    nQubits : int
+        The number of qubits.
+
+    model : CloudNoiseModel
+        The model.  Its parameter vector must be up to date, e.g. by having
+        just called `model.to_vector()`.
+
+    Returns
+    -------
+    list
+        A list of `(nTargetQubits, labels, ham_indices, sto_indices, aff_indices)`
+        tuples, one per factor.  `labels` is a list of the `nQubits`-qubit
+        labels (e.g. `"IXZ"`) of the factor's nontrivial Paulis, and the index
+        arrays give the positions of the Hamiltonian, stochastic, and affine
+        coefficients of these Paulis within `model.to_vector()`.
+    """
+    factor_params = []
+    all_indices = _np.arange(model.num_params())
+    #assumes Implicit model w/'globalIdle' as a composed gate...
+    # each factor applies to some set of the qubits (of size 1 to the max-error-weight)
+    for factor in model.operation_blks['layers']['globalIdle'].factorops:
+        #print("Factor: target = %s, gpindices=%s" % (str(factor.targetLabels),str(factor.gpindices)))
+        assert(isinstance(factor, _objs.EmbeddedOp)), "Expected Gi to be a composition of embedded gates!"
+        indices = all_indices[factor.gpindices]
+        bsH = factor.embedded_op.errorgen.ham_basis_size
+        bsO = factor.embedded_op.errorgen.other_basis_size
+        ham_indices = indices[0:bsH - 1]  # -1s b/c bsH, bsO include identity in basis
+        sto_indices = indices[bsH - 1:bsH - 1 + bsO - 1]
+        aff_indices = indices[bsH - 1 + bsO - 1:bsH - 1 + 2 * (bsO - 1)]
+
+        labels = []
+        target_qubits = [int(i[1:]) for i in factor.targetLabels]  # i is something like "Q0" so int(i[1:]) = 0
+        for tup in nontrivial_paulis(len(factor.targetLabels)):
+            lst = ['I'] * nQubits
+            for q, P in zip(target_qubits, tup):
+                lst[q] = P
+            labels.append("".join(lst))
+
+        factor_params.append((len(factor.targetLabels), labels, ham_indices, sto_indices, aff_indices))
+    return factor_params
 
 
 def set_idle_errors(nQubits, model, errdict, rand_default=None,
@@ -196,60 +265,32 @@ def set_idle_errors(nQubits, model, errdict, rand_default=None,
     """
     rand_rates = []; i_rand_default = 0
     v = model.to_vector()
-    #assumes Implicit model w/'globalIdle' as a composed gate...
-    # each factor applies to some set of the qubits (of size 1 to the max-error-weight)
-    for i, factor in enumerate(model.operation_blks['layers']['globalIdle'].factorops):
-        #print("Factor %d: target = %s, gpindices=%s" % (i,str(factor.targetLabels),str(factor.gpindices)))
-        assert(isinstance(factor, _objs.EmbeddedOp)), "Expected Gi to be a composition of embedded gates!"
-        sub_v = v[factor.gpindices]
-        bsH = factor.embedded_op.errorgen.ham_basis_size
-        bsO = factor.embedded_op.errorgen.other_basis_size
-        if hamiltonian: hamiltonian_sub_v = sub_v[0:bsH - 1]  # -1s b/c bsH, bsO include identity in basis
-        if stochastic: stochastic_sub_v = sub_v[bsH - 1:bsH - 1 + bsO - 1]
-        if affine: affine_sub_v = sub_v[bsH - 1 + bsO - 1:bsH - 1 + 2 * (bsO - 1)]
-
-        for k, tup in enumerate(nontrivial_paulis(len(factor.targetLabels))):
-            lst = ['I'] * nQubits
-            for ii, i in enumerate(factor.targetLabels):
-                lst[int(i[1:])] = tup[ii]  # i is something like "Q0" so int(i[1:]) extracts the 0
-            label = "".join(lst)
-
-            if "S(%s)" % label in errdict:
-                Srate = errdict["S(%s)" % label]
-            elif rand_default is None:
-                Srate = 0.0
-            elif isinstance(rand_default, float):
-                Srate = rand_default * _np.random.random()
-                rand_rates.append(Srate)
-            else:  # assume rand_default is array-like, and gives default rates
-                Srate = rand_default[i_rand_default]
-                i_rand_default += 1
-
-            if "H(%s)" % label in errdict:
-                Hrate = errdict["H(%s)" % label]
-            elif rand_default is None:
-                Hrate = 0.0
-            elif isinstance(rand_default, float):
-                Hrate = rand_default * _np.random.random()
-                rand_rates.append(Hrate)
-            else:  # assume rand_default is array-like, and gives default rates
-                Hrate = rand_default[i_rand_default]
-                i_rand_default += 1
-
-            if "A(%s)" % label in errdict:
-                Arate = errdict["A(%s)" % label]
-            elif rand_default is None:
-                Arate = 0.0
-            elif isinstance(rand_default, float):
-                Arate = rand_default * _np.random.random()
-                rand_rates.append(Arate)
-            else:  # assume rand_default is array-like, and gives default rates
-                Arate = rand_default[i_rand_default]
-                i_rand_default += 1
-
-            if hamiltonian: hamiltonian_sub_v[k] = Hrate
-            if stochastic: stochastic_sub_v[k] = _np.sqrt(Srate)  # b/c param gets squared
-            if affine: affine_sub_v[k] = Arate
+    for _, labels, ham_indices, sto_indices, aff_indices in _idle_factor_params(nQubits, model):
+
+        #Gather the S, H, and A rates (in that order, which is the order default rates
+        # are taken in) of each Pauli from errdict, noting which ones need a default.
+        rates = _np.zeros((len(labels), 3), 'd')  # columns are S, H, A rates
+        needs_default = _np.zeros((len(labels), 3), bool)
+        for k, label in enumerate(labels):
+            for j, typ in enumerate(("S", "H", "A")):
+                key = "%s(%s)" % (typ, label)
+                if key in errdict: rates[k, j] = errdict[key]
+                else: needs_default[k, j] = True
+
+        nDefaults = _np.count_nonzero(needs_default)
+        if rand_default is None:
+            pass  # default rates are zero
+        elif isinstance(rand_default, float):
+            default_rates = rand_default * _np.random.random(nDefaults)
+            rates[needs_default] = default_rates  # (boolean indexing fills in row-major order)
+            rand_rates.extend(default_rates)
+        else:  # assume rand_default is array-like, and gives default rates
+            rates[needs_default] = rand_default[i_rand_default:i_rand_default + nDefaults]
+            i_rand_default += nDefaults
+
+        if hamiltonian: v[ham_indices] = rates[:, 1]
+        if stochastic: v[sto_indices] = _np.sqrt(rates[:, 0])  # b/c param gets squared
+        if affine: v[aff_indices] = rates[:, 2]
 
     model.from_vector(v)
     return _np.array(rand_rates, 'd')  # the random rates that were chosen (to keep track of them for later)
@@ -288,38 +329,24 @@ def get_idle_errors(nQubits, model, hamiltonian=True, stochastic=True, affine=Tr
     sto_rates = {}
     aff_rates = {}
     v = model.to_vector()
-    #assumes Implicit model w/'globalIdle' as a composed gate...
-    for i, factor in enumerate(model.operation_blks['layers']['globalIdle'].factorops):
-        # each factor applies to some set of the qubits (of size 1 to the max-error-weight)
-
-        #print("Factor %d: target = %s, gpindices=%s" % (i,str(factor.targetLabels),str(factor.gpindices)))
-        assert(isinstance(factor, _objs.EmbeddedOp)), "Expected Gi to be a composition of embedded gates!"
-        sub_v = v[factor.gpindices]
-        bsH = factor.embedded_op.errorgen.ham_basis_size
-        bsO = factor.embedded_op.errorgen.other_basis_size
-        if hamiltonian: hamiltonian_sub_v = sub_v[0:bsH - 1]  # -1s b/c bsH, bsO include identity in basis
-        if stochastic: stochastic_sub_v = sub_v[bsH - 1:bsH - 1 + bsO - 1]
-        if affine: affine_sub_v = sub_v[bsH - 1 + bsO - 1:bsH - 1 + 2 * (bsO - 1)]
-
-        nTargetQubits = len(factor.targetLabels)
-
-        for k, tup in enumerate(nontrivial_paulis(len(factor.targetLabels))):
-            lst = ['I'] * nQubits
-            for ii, i in enumerate(factor.targetLabels):
-                lst[int(i[1:])] = tup[ii]  # i is something like "Q0" so int(i[1:]) extracts the 0
-            label = "".join(lst)
-
-            #For explanation of why `scale` is set as it is, see comments in
-            # the `predicted_intrinsic_rates(...)` function.
-            if hamiltonian and abs(hamiltonian_sub_v[k]) > 1e-6:
-                scale = _np.sqrt(2**(2 - nTargetQubits)) if scale_for_idt else 1.0
-                ham_rates[label] = hamiltonian_sub_v[k] * scale
-            if stochastic and abs(stochastic_sub_v[k]) > 1e-6:
-                scale = 1. / (2**nTargetQubits) if scale_for_idt else 1.0
-                sto_rates[label] = stochastic_sub_v[k]**2 * scale
-            if affine and abs(affine_sub_v[k]) > 1e-6:
-                scale = 1. / (_np.sqrt(2)**nTargetQubits) if scale_for_idt else 1.0
-                aff_rates[label] = affine_sub_v[k] * scale
+    for nTargetQubits, labels, ham_indices, sto_indices, aff_indices in _idle_factor_params(nQubits, model):
+        #For explanation of why the scales are set as they are, see comments in
+        # the `predicted_intrinsic_rates(...)` function.
+        if hamiltonian:
+            hamiltonian_sub_v = v[ham_indices]
+            scale = _np.sqrt(2**(2 - nTargetQubits)) if scale_for_idt else 1.0
+            for k in _np.flatnonzero(_np.abs(hamiltonian_sub_v) > 1e-6):
+                ham_rates[labels[k]] = hamiltonian_sub_v[k] * scale
+        if stochastic:
+            stochastic_sub_v = v[sto_indices]
+            scale = 1. / (2**nTargetQubits) if scale_for_idt else 1.0
+            for k in _np.flatnonzero(_np.abs(stochastic_sub_v) > 1e-6):
+                sto_rates[labels[k]] = stochastic_sub_v[k]**2 * scale
+        if affine:
+            affine_sub_v = v[aff_indices]
+            scale = 1. / (_np.sqrt(2)**nTargetQubits) if scale_for_idt else 1.0
+            for k in _np.flatnonzero(_np.abs(affine_sub_v) > 1e-6):
+                aff_rates[labels[k]] = affine_sub_v[k] * scale
 
     return ham_rates, sto_rates, aff_rates
 
@@ -353,6 +380,7 @@ def predicted_intrinsic_rates(nQubits, maxweight, model,
         `stochastic` or `affine` is set to False.
     """
     error_labels = [str(pauliOp.rep) for pauliOp in allerrors(nQubits, maxweight)]
+    error_indices = {lbl: i for i, lbl in enumerate(error_labels)}  # index of each label in `error_labels`
     v = model.to_vector()
 
     if hamiltonian:
@@ -367,49 +395,27 @@ def predicted_intrinsic_rates(nQubits, maxweight, model,
         aff_intrinsic_rates = _np.zeros(len(error_labels), 'd')
     else: aff_intrinsic_rates = None
 
-    for i, factor in enumerate(model.operation_blks['layers']['globalIdle'].factorops):
-        #print("Factor %d: target = %s, gpindices=%s" % (i,str(factor.targetLabels),str(factor.gpindices)))
-        assert(isinstance(factor, _objs.EmbeddedOp)), "Expected Gi to be a composition of embedded gates!"
-        sub_v = v[factor.gpindices]
-        bsH = factor.embedded_op.errorgen.ham_basis_size
-        bsO = factor.embedded_op.errorgen.other_basis_size
-        if hamiltonian: hamiltonian_sub_v = sub_v[0:bsH - 1]  # -1s b/c bsH, bsO include identity in basis
-        if stochastic: stochastic_sub_v = sub_v[bsH - 1:bsH - 1 + bsO - 1]
-        if affine: affine_sub_v = sub_v[bsH - 1 + bsO - 1:bsH - 1 + 2 * (bsO - 1)]
+    for nTargetQubits, labels, ham_indices, sto_indices, aff_indices in _idle_factor_params(nQubits, model):
+        result_indices = [error_indices[label] for label in labels]
 
-        for k, tup in enumerate(nontrivial_paulis(len(factor.targetLabels))):
-            lst = ['I'] * nQubits
-            for ii, i in enumerate(factor.targetLabels):
-                lst[int(i[1:])] = tup[ii]  # i is something like "Q0" so int(i[1:]) extracts the 0
-            label = "".join(lst)
-            if stochastic: sval = stochastic_sub_v[k]
-            if hamiltonian: hval = hamiltonian_sub_v[k]
-            if affine: aval = affine_sub_v[k]
-
-            nTargetQubits = len(factor.targetLabels)
-
-            if stochastic:
-                # each Stochastic term has two Paulis in it (on either side of rho), each of which is
-                # scaled by 1/sqrt(d), so 1/d in total, where d = 2**nQubits
-                sscaled_val = sval**2 / (2**nTargetQubits)  # val**2 b/c it's a *stochastic* term parameter
-
-            if hamiltonian:
-                # each Hamiltonian term, to fix missing scaling factors in Hamiltonian jacobian
-                # elements, needs a sqrt(d) for each trivial ('I') Pauli... ??
-                hscaled_val = hval * _np.sqrt(2**(2 - nTargetQubits))  # TODO: figure this out...
-                # 1Q: sqrt(2)
-                # 2Q: nqubits-targetqubits (sqrt(2) on 1Q)
-                # 4Q: sqrt(2)**-2
+        if stochastic:
+            # each Stochastic term has two Paulis in it (on either side of rho), each of which is
+            # scaled by 1/sqrt(d), so 1/d in total, where d = 2**nQubits
+            # (val**2 b/c it's a *stochastic* term parameter)
+            sto_intrinsic_rates[result_indices] = v[sto_indices]**2 / (2**nTargetQubits)
 
-            if affine:
-                ascaled_val = aval * 1 / (_np.sqrt(2)**nTargetQubits)  # not exactly sure how this is derived
-                # 1Q: sqrt(2)/6
-                # 2Q: 1/3 * 10-2
+        if hamiltonian:
+            # each Hamiltonian term, to fix missing scaling factors in Hamiltonian jacobian
+            # elements, needs a sqrt(d) for each trivial ('I') Pauli... ??
+            ham_intrinsic_rates[result_indices] = v[ham_indices] * _np.sqrt(2**(2 - nTargetQubits))  # TODO
+            # 1Q: sqrt(2)
+            # 2Q: nqubits-targetqubits (sqrt(2) on 1Q)
+            # 4Q: sqrt(2)**-2
 
-            result_index = error_labels.index(label)
-            if hamiltonian: ham_intrinsic_rates[result_index] = hscaled_val
-            if stochastic: sto_intrinsic_rates[result_index] = sscaled_val
-            if affine: aff_intrinsic_rates[result_index] = ascaled_val
+        if affine:
+            aff_intrinsic_rates[result_indices] = v[aff_indices] / (_np.sqrt(2)**nTargetQubits)  # not sure how derived
+            # 1Q: sqrt(2)/6
+            # 2Q: 1/3 * 10-2
 
     return ham_intrinsic_rates, sto_intrinsic_rates, aff_intrinsic_rates
 
@@ -445,53 +451,57 @@ def predicted_observable_rates(idtresults, typ, nQubits, maxweight, model):
         to match the structure of an IdleTomographyResults object's
         `
     """
-    intrinsic = None
+    if typ not in ("samebasis", "diffbasis"):
+        raise ValueError("Unknown `typ` argument: %s" % typ)
+
     ret = {}
+    fidpairs = idtresults.pauli_fidpairs[typ]
+    infos = idtresults.observed_rate_infos[typ]
+
+    #The intrinsic rates are the same for every fidpair, and which ones are needed
+    # only depends on whether the jacobian rows include affine errors - so compute
+    # them once, using any info dict to check for affine errors.
+    some_info_dict = next((info_dict for dict_of_infos in infos for info_dict in dict_of_infos.values()), None)
+    if some_info_dict is None:
+        return {fidpair: {} for fidpair in fidpairs}  # no observed rates to predict
 
     if typ == "samebasis":
 
         Ne = len(idtresults.error_list)
-        for fidpair, dict_of_infos in zip(idtresults.pauli_fidpairs[typ],
-                                          idtresults.observed_rate_infos[typ]):
-            ret[fidpair] = {}
-            for obsORoutcome, info_dict in dict_of_infos.items():
-                #Get jacobian row and compute predicted observed rate
-                Jrow = info_dict['jacobian row']
+        affine = bool(len(some_info_dict['jacobian row']) == 2 * Ne)  # affine included?
+        _, sto_intrinsic_rates, aff_intrinsic_rates = \
+            predicted_intrinsic_rates(nQubits, maxweight, model, False, True, affine)
+        intrinsic = _np.concatenate([sto_intrinsic_rates, aff_intrinsic_rates]) if affine else sto_intrinsic_rates
 
-                if intrinsic is None:
-                    # compute intrinsic (wait for jac row to check length)
-                    affine = bool(len(Jrow) == 2 * Ne)  # affine included?
-                    _, sto_intrinsic_rates, aff_intrinsic_rates = \
-                        predicted_intrinsic_rates(nQubits, maxweight, model, False, True, affine)
-                    intrinsic = _np.concatenate([sto_intrinsic_rates, aff_intrinsic_rates]) \
+        for fidpair, dict_of_infos in zip(fidpairs, infos):
+            ret[fidpair] = {}
+            if len(dict_of_infos) == 0: continue
 
-                predicted_rate = _np.dot(Jrow, intrinsic)
-                ret[fidpair][obsORoutcome] = predicted_rate
+            #Stack the jacobian rows and compute all of this fidpair's predicted observed rates at once
+            obsORoutcomes = list(dict_of_infos.keys())
+            J = _np.array([dict_of_infos[x]['jacobian row'] for x in obsORoutcomes])
+            ret[fidpair].update(zip(obsORoutcomes, _np.dot(J, intrinsic)))
 
-    elif typ == "diffbasis":
+    else:  # typ == "diffbasis"
 
         # J_ham * Hintrinsic = observed_rates - J_aff * Aintrinsic
         # so: observed_rates = J_ham * Hintrinsic + J_aff * Aintrinsic
-        for fidpair, dict_of_infos in zip(idtresults.pauli_fidpairs[typ],
-                                          idtresults.observed_rate_infos[typ]):
+        affine = bool('affine jacobian row' in some_info_dict)  # (either all or none of the rows have one)
+        ham_intrinsic_rates, _, aff_intrinsic_rates = \
+            predicted_intrinsic_rates(nQubits, maxweight, model, True, False, affine)
+
+        for fidpair, dict_of_infos in zip(fidpairs, infos):
             ret[fidpair] = {}
-            for obsORoutcome, info_dict in dict_of_infos.items():
-                #Get jacobian row and compute predicted observed rate
-                Jrow = info_dict['jacobian row']
-
-                if intrinsic is None:
-                    # compute intrinsic (wait for jac row to check for affine)
-                    affine = bool('affine jacobian row' in info_dict)
-                    ham_intrinsic_rates, _, aff_intrinsic_rates = \
-                        predicted_intrinsic_rates(nQubits, maxweight, model, True, False, affine)
-
-                predicted_rate = _np.dot(Jrow, ham_intrinsic_rates)
-                if 'affine jacobian row' in info_dict:
-                    affJrow = info_dict['affine jacobian row']
-                    predicted_rate += _np.dot(affJrow, aff_intrinsic_rates)
-                ret[fidpair][obsORoutcome] = predicted_rate
-
-    else:
-        raise ValueError("Unknown `typ` argument: %s" % typ)
+            if len(dict_of_infos) == 0: continue
+
+            #Stack the jacobian rows and compute all of this fidpair's predicted observed rates at once
+            obsORoutcomes = list(dict_of_infos.keys())
+            info_dicts = [dict_of_infos[x] for x in obsORoutcomes]
+            J = _np.array([info_dict['jacobian row'] for info_dict in info_dicts])
+            predicted_rates = _np.dot(J, ham_intrinsic_rates)
+            if affine:
+                affJ = _np.array([info_dict['affine jacobian row'] for info_dict in info_dicts])
+                predicted_rates += _np.dot(affJ, aff_intrinsic_rates)
+            ret[fidpair].update(zip(obsORoutcomes, predicted_rates))
 
     return ret
@@ -22,8 +22,21 @@ import copy as _copy
 import itertools as _itertools
 
 
+def _get_label(name, qubits, cache=None):
+    """
+    Returns `Label(name, qubits)`. If `cache` is not None, the Label is stored in it, and the
+    Label stored by an earlier call is reused if there is one (Labels are immutable, and
+    constructing them is a significant part of sampling a layer).
+    """
+    if cache is None: return _lbl.Label(name, qubits)
+    key = ('label', name, qubits)
+    if key not in cache:
+        cache[key] = _lbl.Label(name, qubits)
+    return cache[key]
+
+
 def circuit_layer_by_pairing_qubits(pspec, subsetQs=None, twoQprob=0.5, oneQgatenames='all',
-                                    twoQgatenames='all', modelname='clifford'):
+                                    twoQgatenames='all', modelname='clifford', randState=None, cache=None):
     """
     Samples a random circuit layer by pairing up qubits and picking a two-qubit gate for a pair
     with the specificed probability. This sampler *assumes* all-to-all connectivity, and does
@@ -69,12 +82,25 @@ def circuit_layer_by_pairing_qubits(pspec, subsetQs=None, twoQprob=0.5, oneQgate
         `pspec.models` to use to extract the gate-set. The `clifford` default is suitable
         for Clifford or direct RB, but will not use any non-Clifford gates in the gate-set.
 
+    randState : numpy.random.RandomState, optional
+        A RandomState object to generate samples from. If None, numpy's global random
+        state is used (so results can be made reproducible with `numpy.random.seed`).
+
+    cache : dict, optional
+        If not None, a dictionary in which the sampler stores what it computes from `pspec`
+        (e.g., the gates that act on each qubit, and gate Labels), so that this can be reused
+        when sampling further layers. It must only be reused with the same `pspec`;
+        `random_circuit` uses one for all the layers of a circuit.
+
     Returns
     -------
     list of Labels
         A list of gate Labels that defines a "complete" circuit layer (there is one and only
         one gate acting on each qubit in `pspec` or `subsetQs`).
     """
+    if randState is None: rndm = _np.random  # use numpy's global random state
+    else: rndm = randState
+
     if subsetQs is None: n = pspec.number_of_qubits
     else:
         assert(isinstance(subsetQs, list) or isinstance(subsetQs, tuple)), "SubsetQs must be a list or a tuple!"
@@ -102,50 +128,93 @@ def circuit_layer_by_pairing_qubits(pspec, subsetQs=None, twoQprob=0.5, oneQgate
                 if (gate.number_of_qubits == 2) and (gate.name not in twoQgatenames):
                     twoQgatenames.append(gate.name)
 
-    # Basic variables required for sampling the circuit layer.
+    # Basic variables required for sampling the circuit layer. The qubit labels are only read
+    # (a shuffled copy is made below), so there is no need to copy them here.
     if subsetQs is None:
-        qubits = list(pspec.qubit_labels[:])  # copy this list
+        qubits = pspec.qubit_labels
     else:
-        qubits = list(subsetQs[:])  # copy this list
+        qubits = subsetQs
     sampled_layer = []
     num_oneQgatenames = len(oneQgatenames)
     num_twoQgatenames = len(twoQgatenames)
 
-    # If there is an odd number of qubits, begin by picking one to have a 1-qubit gate.
-    if n % 2 != 0:
-        q = qubits[_np.random.randint(0, n)]
-        name = oneQgatenames[_np.random.randint(0, num_oneQgatenames)]
-        del qubits[q]
-        sampled_layer.append(_lbl.Label(name, q))
+    # Put the qubits in a uniformly random order. If there is an odd number of qubits, the last
+    # qubit is the one to have a 1-qubit gate, and the other qubits are paired up in this order.
+    qubits = [qubits[i] for i in rndm.permutation(n)]
+    oneQubit_qubits = qubits[2 * (n // 2):]
 
-    # Go through n//2 times until all qubits have been paired up and gates on them sampled
+    # Flip a coin for each pair to decide whether to act a two-qubit gate on that pair.
+    twoQgate_on_pair = rndm.random_sample(n // 2) < twoQprob
+    num_twoQgates = _np.count_nonzero(twoQgate_on_pair)
     for i in range(n // 2):
+        if not twoQgate_on_pair[i]:
+            # Independently, pick uniformly random 1-qubit gates to apply to each qubit of the pair.
+            oneQubit_qubits.extend(qubits[2 * i:2 * i + 2])
 
-        # Pick two of the remaining qubits : each qubit that is picked is deleted from the list.
-        index = _np.random.randint(0, len(qubits))
-        q1 = qubits[index]
-        del qubits[index]
-        index = _np.random.randint(0, len(qubits))
-        q2 = qubits[index]
-        del qubits[index]
-
-        # Flip a coin to decide whether to act a two-qubit gate on that qubit
-        if _np.random.binomial(1, twoQprob) == 1:
-            # If there is more than one two-qubit gate on the pair, pick a uniformly random one.
-            name = twoQgatenames[_np.random.randint(0, num_twoQgatenames)]
-            sampled_layer.append(_lbl.Label(name, (q1, q2)))
-        else:
-            # Independently, pick uniformly random 1-qubit gates to apply to each qubit.
-            name1 = oneQgatenames[_np.random.randint(0, num_oneQgatenames)]
-            name2 = oneQgatenames[_np.random.randint(0, num_oneQgatenames)]
-            sampled_layer.append(_lbl.Label(name1, q1))
-            sampled_layer.append(_lbl.Label(name2, q2))
+    # If there is more than one two-qubit gate on a pair, pick a uniformly random one.
+    if num_twoQgates > 0:
+        names = [twoQgatenames[j] for j in rndm.randint(0, num_twoQgatenames, size=num_twoQgates)]
+        sampled_layer.extend(_get_label(name, (qubits[2 * i], qubits[2 * i + 1]), cache)
+                             for i, name in zip(_np.flatnonzero(twoQgate_on_pair), names))
+
+    # Pick uniformly random 1-qubit gates for all the qubits that don't have a 2-qubit gate.
+    if len(oneQubit_qubits) > 0:
+        names = [oneQgatenames[j] for j in rndm.randint(0, num_oneQgatenames, size=len(oneQubit_qubits))]
+        sampled_layer.extend(_get_label(name, q, cache) for q, name in zip(oneQubit_qubits, names))
 
     return sampled_layer
 
 
+def _get_gates_on_qubits(pspec, modelname, qubits, cache=None):
+    """
+    Indexes the 1-qubit and 2-qubit gates of `pspec.models[modelname]` that act only on
+    `qubits` by the qubits that they act on.
+
+    Parameters
+    ----------
+    pspec : ProcessorSpec
+        The ProcessorSpec whose model's primitive operation labels are indexed.
+
+    modelname : str
+        The key of the model in `pspec.models`.
+
+    qubits : list or tuple
+        The labels of the qubits to keep the gates on.
+
+    cache : dict, optional
+        If not None, the index is stored in (and, if it is already there, taken from) this
+        dictionary, so that the gates of the model don't have to be re-filtered every time a
+        circuit layer is sampled. It must only be used with this `pspec`.
+
+    Returns
+    -------
+    oneQgates_on_qubit, twoQgates_on_qubit : dict
+        Dictionaries whose keys are qubit labels and whose values are tuples of the 1-qubit
+        and 2-qubit gates, respectively, that act on that qubit. If `cache` is not None these
+        are shared with other users of `cache`, so they must not be altered.
+    """
+    key = ('gates on qubits', modelname, tuple(qubits))
+    if cache is not None and key in cache: return cache[key]
+
+    qubit_set = set(qubits)
+    oneQgates_on_qubit = {}
+    twoQgates_on_qubit = {}
+    for gate in pspec.models[modelname].get_primitive_op_labels():
+        if gate.number_of_qubits == 1:
+            if gate.qubits[0] in qubit_set:
+                oneQgates_on_qubit.setdefault(gate.qubits[0], []).append(gate)
+        elif gate.number_of_qubits == 2:
+            if qubit_set.issuperset(gate.qubits):
+                for qubit in gate.qubits:
+                    twoQgates_on_qubit.setdefault(qubit, []).append(gate)
+    gates_on_qubits = ({q: tuple(gates) for q, gates in oneQgates_on_qubit.items()},
+                       {q: tuple(gates) for q, gates in twoQgates_on_qubit.items()})
+    if cache is not None: cache[key] = gates_on_qubits
+    return gates_on_qubits
+
+
 def circuit_layer_by_Qelimination(pspec, subsetQs=None, twoQprob=0.5, oneQgates='all',
-                                  twoQgates='all', modelname='clifford'):
+                                  twoQgates='all', modelname='clifford', randState=None, cache=None):
     """
     Samples a random circuit layer by eliminating qubits one by one. This sampler works
     with any connectivity, but the expected number of 2-qubit gates in a layer depends
@@ -197,49 +266,51 @@ def circuit_layer_by_Qelimination(pspec, subsetQs=None, twoQprob=0.5, oneQgates=
         `pspec.models` to use to extract the model. The `clifford` default is suitable
         for Clifford or direct RB, but will not use any non-Clifford gates in the model.
 
+    randState : numpy.random.RandomState, optional
+        A RandomState object to generate samples from. If None, numpy's global random
+        state is used (so results can be made reproducible with `numpy.random.seed`).
+
+    cache : dict, optional
+        If not None, a dictionary in which the sampler stores what it computes from `pspec`
+        (e.g., the gates that act on each qubit, and gate Labels), so that this can be reused
+        when sampling further layers. It must only be reused with the same `pspec`;
+        `random_circuit` uses one for all the layers of a circuit.
+
     Returns
     -------
     list of gates
         A list of gate Labels that defines a "complete" circuit layer (there is one and
         only one gate acting on each qubit in `pspec` or `subsetQs`).
     """
+    if randState is None: rndm = _np.random  # use numpy's global random state
+    else: rndm = randState
+
+    # The qubit labels are only read, so there is no need to copy them.
     if subsetQs is None:
         n = pspec.number_of_qubits
-        qubits = list(pspec.qubit_labels[:])  # copy this list
+        qubits = pspec.qubit_labels
     else:
         assert(isinstance(subsetQs, (list, tuple))), "SubsetQs must be a list or a tuple!"
         n = len(subsetQs)
-        qubits = list(subsetQs[:])  # copy this list
+        qubits = subsetQs
 
-    # If oneQgates is specified, use the given list.
+    # If oneQgates or twoQgates is not specified, extract the gates on each qubit from the ProcessorSpec.
+    if (oneQgates == 'all') or (twoQgates == 'all'):
+        oneQgates_on_qubit, twoQgates_on_qubit = _get_gates_on_qubits(pspec, modelname, qubits, cache)
+
+    # If oneQgates is specified, use the given list, indexed by the qubits the gates act on.
     if oneQgates != 'all':
-        oneQgates_available = _copy.copy(oneQgates)
-    # If oneQgates is not specified, extract this list from the ProcessorSpec
-    else:
-        oneQgates_available = list(pspec.models[modelname].get_primitive_op_labels())
-        d = len(oneQgates_available)
-        for i in range(0, d):
-            # If it's not a 1-qubit gate, we delete it.
-            if oneQgates_available[d - 1 - i].number_of_qubits != 1:
-                del oneQgates_available[d - 1 - i]
-            # If it's not a gate on the allowed qubits, we delete it.
-            elif oneQgates_available[d - 1 - i].qubits[0] not in qubits:
-                del oneQgates_available[d - 1 - i]
-
-    # If twoQgates is specified, use the given list.
+        oneQgates_on_qubit = {}
+        for gate in oneQgates:
+            for qubit in gate.qubits:
+                oneQgates_on_qubit.setdefault(qubit, []).append(gate)
+
+    # If twoQgates is specified, use the given list, indexed by the qubits the gates act on.
     if twoQgates != 'all':
-        twoQgates_available = _copy.copy(twoQgates)
-    # If twoQgates is not specified, extract this list from the ProcessorSpec
-    else:
-        twoQgates_available = list(pspec.models[modelname].get_primitive_op_labels())
-        d = len(twoQgates_available)
-        for i in range(0, d):
-            # If it's not a 2-qubit gate, we delete it.
-            if twoQgates_available[d - 1 - i].number_of_qubits != 2:
-                del twoQgates_available[d - 1 - i]
-            # If it's not a gate on the allowed qubits, we delete it.
-            elif not set(twoQgates_available[d - 1 - i].qubits).issubset(set(qubits)):
-                del twoQgates_available[d - 1 - i]
+        twoQgates_on_qubit = {}
+        for gate in twoQgates:
+            for qubit in gate.qubits:
+                twoQgates_on_qubit.setdefault(qubit, []).append(gate)
 
     # If the `twoQprob` is not None, we specify a weighting towards 2-qubit gates
     if twoQprob is not None:
@@ -247,32 +318,24 @@ def circuit_layer_by_Qelimination(pspec, subsetQs=None, twoQprob=0.5, oneQgates=
 
     # Prep the sampling variables.
     sampled_layer = []
-    remaining_qubits = _copy.deepcopy(qubits)
-    num_qubits_used = 0
+    used_qubits = set()  # A gate is still available iff it acts on none of these qubits.
 
-    # Go through until all qubits have been assigned a gate.
-    while num_qubits_used < n:
+    # Go through the qubits in a uniformly random order, skipping those that have already been
+    # assigned a gate. The next qubit that hasn't been assigned a gate is then a uniformly random
+    # one of the remaining qubits.
+    for index in rndm.permutation(n):
 
         # Pick a random qubit
-        r = _np.random.randint(0, n - num_qubits_used)
-        q = remaining_qubits[r]
-        del remaining_qubits[r]
+        q = qubits[index]
+        if q in used_qubits: continue
 
         # Find the 1Q gates that act on q.
-        oneQgates_remaining_on_q = []
-        ll = len(oneQgates_available)
-        for i in range(0, ll):
-            if q in oneQgates_available[ll - 1 - i].qubits:
-                oneQgates_remaining_on_q.append(oneQgates_available[ll - 1 - i])
-                del oneQgates_available[ll - 1 - i]
+        oneQgates_remaining_on_q = oneQgates_on_qubit.get(q, [])
 
         # Find the 2Q gates that act on q and a remaining qubit.
-        twoQgates_remaining_on_q = []
-        ll = len(twoQgates_available)
-        for i in range(0, ll):
-            if q in twoQgates_available[ll - 1 - i].qubits:
-                twoQgates_remaining_on_q.append(twoQgates_available[ll - 1 - i])
-                del twoQgates_available[ll - 1 - i]
+        twoQgates_remaining_on_q = [gate for gate in twoQgates_on_qubit.get(q, [])
+                                    if used_qubits.isdisjoint(gate.qubits)]
+        used_qubits.add(q)
 
         # If twoQprob is None, there is no weighting towards 2-qubit gates.
         if twoQprob is None:
@@ -283,20 +346,18 @@ def circuit_layer_by_Qelimination(pspec, subsetQs=None, twoQprob=0.5, oneQgates=
         if len(twoQgates_remaining_on_q) == 0:
             xx = 1
         else:
-            xx = _np.random.choice([1, 2], p=weighting)
+            xx = rndm.choice([1, 2], p=weighting)
 
         # Implement a 1-qubit gate on qubit q.
         if xx == 1:
             # Sample the gate
-            r = _np.random.randint(0, len(oneQgates_remaining_on_q))
+            r = rndm.randint(0, len(oneQgates_remaining_on_q))
             sampled_layer.append(oneQgates_remaining_on_q[r])
-            # We have assigned gates to 1 of the remaining qubits.
-            num_qubits_used += 1
 
         # Implement a 2-qubit gate on qubit q.
         if xx == 2:
             # Sample the gate
-            r = _np.random.randint(0, len(twoQgates_remaining_on_q))
+            r = rndm.randint(0, len(twoQgates_remaining_on_q))
             sampled_layer.append(twoQgates_remaining_on_q[r])
 
             # Find the label of the other qubit in the sampled gate.
@@ -304,29 +365,14 @@ def circuit_layer_by_Qelimination(pspec, subsetQs=None, twoQprob=0.5, oneQgates=
             if other_qubit == q:
                 other_qubit = twoQgates_remaining_on_q[r].qubits[1]
 
-            # Delete the gates on this other qubit from the 1-qubit gate list.
-            ll = len(oneQgates_available)
-            for i in range(0, ll):
-                if other_qubit in oneQgates_available[ll - 1 - i].qubits:
-                    del oneQgates_available[ll - 1 - i]
-
-            # Delete the gates on this other qubit from the 2-qubit gate list.
-            ll = len(twoQgates_available)
-            for i in range(0, ll):
-                if other_qubit in twoQgates_available[ll - 1 - i].qubits:
-                    del twoQgates_available[ll - 1 - i]
-
-            # Delete this other qubit from remaining qubits list.
-            del remaining_qubits[remaining_qubits.index(other_qubit)]
-
-            # We have assigned gates to 2 of the remaining qubits.
-            num_qubits_used += 2
+            # Mark this other qubit as used, so that no more gates on it are available.
+            used_qubits.add(other_qubit)
 
     return sampled_layer
 
 
 def circuit_layer_by_co2Qgates(pspec, subsetQs, co2Qgates, co2Qgatesprob='uniform', twoQprob=1.0,
-                               oneQgatenames='all', modelname='clifford'):
+                               oneQgatenames='all', modelname='clifford', randState=None, cache=None):
     """
     Samples a random circuit layer using the specified list of "compatible two-qubit gates"
     (co2Qgates). That is, the user inputs a list (`co2Qgates`) specifying 2-qubit gates that are
@@ -412,49 +458,72 @@ def circuit_layer_by_co2Qgates(pspec, subsetQs, co2Qgates, co2Qgatesprob='unifor
         extract the model. The `clifford` default is suitable for Clifford or direct RB,
         but will not use any non-Clifford gates in the model.
 
+    randState : numpy.random.RandomState, optional
+        A RandomState object to generate samples from. If None, numpy's global random
+        state is used (so results can be made reproducible with `numpy.random.seed`).
+
+    cache : dict, optional
+        If not None, a dictionary in which the sampler stores what it computes from `pspec`
+        (e.g., the gates that act on each qubit, and gate Labels), so that this can be reused
+        when sampling further layers. It must only be reused with the same `pspec`;
+        `random_circuit` uses one for all the layers of a circuit.
+
     Returns
     -------
     list of gates
         A list of gate Labels that defines a "complete" circuit layer (there is one and
         only one gate acting on each qubit).
     """
+    if randState is None: rndm = _np.random  # use numpy's global random state
+    else: rndm = randState
+
     assert(modelname == 'clifford'), "This function currently assumes sampling from a Clifford model!"
     # Pick the sector.
     if _compat.isstr(co2Qgatesprob):
         assert(co2Qgatesprob == 'uniform'), "If `co2Qgatesprob` is a string it must be 'uniform!'"
-        twoqubitgates_or_nestedco2Qgates = co2Qgates[_np.random.randint(0, len(co2Qgates))]
+        twoqubitgates_or_nestedco2Qgates = co2Qgates[rndm.randint(0, len(co2Qgates))]
     else:
-        co2Qgatesprob = _np.array(co2Qgatesprob) / _np.sum(co2Qgatesprob)
-        x = list(_np.random.multinomial(1, co2Qgatesprob))
-        twoqubitgates_or_nestedco2Qgates = co2Qgates[x.index(1)]
+        co2Qgatesprob = _np.array(co2Qgatesprob, 'd') / _np.sum(co2Qgatesprob)
+        twoqubitgates_or_nestedco2Qgates = co2Qgates[rndm.choice(len(co2Qgatesprob), p=co2Qgatesprob)]
 
     # The special case where the selected co2Qgates contains no gates or co2Qgates.
     if len(twoqubitgates_or_nestedco2Qgates) == 0:
         twoqubitgates = twoqubitgates_or_nestedco2Qgates
     # If it's a nested sector, sample uniformly from the nested co2Qgates.
     elif type(twoqubitgates_or_nestedco2Qgates[0]) == list:
-        twoqubitgates = twoqubitgates_or_nestedco2Qgates[_np.random.randint(0, len(twoqubitgates_or_nestedco2Qgates))]
+        twoqubitgates = twoqubitgates_or_nestedco2Qgates[rndm.randint(0, len(twoqubitgates_or_nestedco2Qgates))]
     # If it's not a list of "co2Qgates" (lists) then this is the list of gates to use.
     else:
         twoqubitgates = twoqubitgates_or_nestedco2Qgates
 
     # Prep the sampling variables
     sampled_layer = []
+    # The qubit labels are only read, so there is no need to copy them.
     if subsetQs is not None:
         assert(isinstance(subsetQs, list) or isinstance(subsetQs, tuple)), "SubsetQs must be a list or a tuple!"
-        remaining_qubits = list(subsetQs[:])  # copy this list
+        qubits = subsetQs
     else:
-        remaining_qubits = pspec.qubit_labels[:]  # copy this list
+        qubits = pspec.qubit_labels
+
+    unassigned_qubits = set(qubits)
 
     # Go through the 2-qubit gates in the sector, and apply each one with probability twoQprob
+    # (the coins for all of the gates are flipped at once).
+    apply_gate = rndm.random_sample(len(twoqubitgates)) < twoQprob
     for i in range(0, len(twoqubitgates)):
-        if _np.random.binomial(1, twoQprob) == 1:
+        if apply_gate[i]:
             gate = twoqubitgates[i]
             # If it's a nested co2Qgates:
             sampled_layer.append(gate)
-            # Delete the qubits that have been assigned a gate.
-            del remaining_qubits[remaining_qubits.index(gate.qubits[0])]
-            del remaining_qubits[remaining_qubits.index(gate.qubits[1])]
+            # Remove the qubits that have been assigned a gate.
+            unassigned_qubits.remove(gate.qubits[0])
+            unassigned_qubits.remove(gate.qubits[1])
+    remaining_qubits = [q for q in qubits if q in unassigned_qubits]
+
+    # If the 1-qubit gate names are not specified, and this isn't the Clifford model (which has
+    # its 1-qubit gates stored in the ProcessorSpec), find the available 1-qubit gates on each qubit.
+    if oneQgatenames == 'all' and modelname != 'clifford':
+        oneQgates_on_qubit, _ = _get_gates_on_qubits(pspec, modelname, qubits, cache)
 
     # Go through the qubits which don't have a 2-qubit gate assigned to them, and pick a 1-qubit gate
     for i in range(0, len(remaining_qubits)):
@@ -463,30 +532,23 @@ def circuit_layer_by_co2Qgates(pspec, subsetQs, co2Qgates, co2Qgatesprob='unifor
 
         # If the 1-qubit gate names are specified, use these.
         if oneQgatenames != 'all':
-            possibleops = [_lbl.Label(name, (qubit,)) for name in oneQgatenames]
+            possibleops = [_get_label(name, (qubit,), cache) for name in oneQgatenames]
 
         # If the 1-qubit gate names are not specified, find the available 1-qubit gates
         else:
             if modelname == 'clifford':
                 possibleops = pspec.clifford_ops_on_qubits[(qubit,)]
             else:
-                possibleops = pspec.models[modelname].get_primitive_op_labels()
-                l = len(possibleops)
-                for j in range(0, l):
-                    if possibleops[l - j].number_of_qubits != 1:
-                        del possibleops[l - j]
-                    else:
-                        if possibleops[l - j].qubits[0] != qubit:
-                            del possibleops[l - j]
-
-        gate = possibleops[_np.random.randint(0, len(possibleops))]
+                possibleops = oneQgates_on_qubit.get(qubit, [])
+
+        gate = possibleops[rndm.randint(0, len(possibleops))]
         sampled_layer.append(gate)
 
     return sampled_layer
 
 
 def circuit_layer_of_oneQgates(pspec, subsetQs=None, oneQgatenames='all', pdist='uniform',
-                               modelname='clifford'):
+                               modelname='clifford', randState=None, cache=None):
     """
     Samples a random circuit layer containing only 1-qubit gates. The allowed
     1-qubit gates are specified by `oneQgatenames`, and the 1-qubit gates are
@@ -521,17 +583,31 @@ def circuit_layer_of_oneQgates(pspec, subsetQs=None, oneQgatenames='all', pdist=
         extract the model. The `clifford` default is suitable for Clifford or direct RB,
         but will not use any non-Clifford gates in the model.
 
+    randState : numpy.random.RandomState, optional
+        A RandomState object to generate samples from. If None, numpy's global random
+        state is used (so results can be made reproducible with `numpy.random.seed`).
+
+    cache : dict, optional
+        If not None, a dictionary in which the sampler stores what it computes from `pspec`
+        (e.g., the gates that act on each qubit, and gate Labels), so that this can be reused
+        when sampling further layers. It must only be reused with the same `pspec`;
+        `random_circuit` uses one for all the layers of a circuit.
+
     Returns
     -------
     list of gates
         A list of gate Labels that defines a "complete" circuit layer (there is one and
         only one gate acting on each qubit).
     """
+    if randState is None: rndm = _np.random  # use numpy's global random state
+    else: rndm = randState
+
+    # The qubit labels are only read, so there is no need to copy them.
     if subsetQs is not None:
         assert(isinstance(subsetQs, list) or isinstance(subsetQs, tuple)), "SubsetQs must be a list or a tuple!"
-        qubits = list(subsetQs[:])  # copy this list
+        qubits = subsetQs
     else:
-        qubits = list(pspec.qubit_labels[:])  # copy this list
+        qubits = pspec.qubit_labels
 
     sampled_layer = []
 
@@ -540,13 +616,17 @@ def circuit_layer_of_oneQgates(pspec, subsetQs=None, oneQgatenames='all', pdist=
     if oneQgatenames == 'all':
         assert(pdist == 'uniform'), "If `oneQgatenames` = 'all', pdist must be 'uniform'"
         if modelname == 'clifford':
+            possibleops = []
             for i in qubits:
                 try:
-                    gate = pspec.clifford_ops_on_qubits[(i,)][_np.random.randint(
-                        0, len(pspec.clifford_ops_on_qubits[(i,)]))]
-                    sampled_layer.append(gate)
+                    ops = pspec.clifford_ops_on_qubits[(i,)]
+                    assert(len(ops) > 0)
                 except:
                     raise ValueError("There are no 1Q Clifford gates on qubit {}!".format(i))
+                possibleops.append(ops)
+            # Draw the index of the gate for every qubit at once (floor(u*k) is uniform over range(k)).
+            indices = (rndm.random_sample(len(possibleops)) * [len(ops) for ops in possibleops]).astype(int)
+            sampled_layer = [ops[j] for ops, j in zip(possibleops, indices)]
         else: raise ValueError("Currently, 'modelname' must be 'clifford'")
 
     else:
@@ -557,23 +637,22 @@ def circuit_layer_of_oneQgates(pspec, subsetQs=None, oneQgatenames='all', pdist=
         # Find out how many 1-qubit gate names there are
         num_oneQgatenames = len(oneQgatenames)
 
-        # Sample a gate for each qubit.
-        for i in qubits:
+        # If 'uniform', then sample the gates for all the qubits at once, according to the uniform dist.
+        if _compat.isstr(pdist):
+            indices = rndm.randint(0, num_oneQgatenames, size=len(qubits))
+            sampled_layer = [_get_label(oneQgatenames[j], i, cache) for i, j in zip(qubits, indices)]
 
-            # If 'uniform', then sample according to the uniform dist.
-            if _compat.isstr(pdist): sampled_gatename = oneQgatenames[_np.random.randint(0, num_oneQgatenames)]
-            # If not 'uniform', then sample according to the user-specified dist.
-            else:
-                pdist = _np.array(pdist) / sum(pdist)
-                x = list(_np.random.multinomial(1, pdist))
-                sampled_gatename = oneQgatenames[x.index(1)]
-            # Add sampled gate to the layer.
-            sampled_layer.append(_lbl.Label(sampled_gatename, i))
+        # If not 'uniform', then sample the gates for all the qubits at once, according to the user-specified dist.
+        else:
+            pdist = _np.array(pdist, 'd') / _np.sum(pdist)
+            indices = rndm.choice(num_oneQgatenames, size=len(qubits), p=pdist)
+            sampled_layer = [_get_label(oneQgatenames[j], i, cache) for i, j in zip(qubits, indices)]
 
     return sampled_layer
 
 
-def random_circuit(pspec, length, subsetQs=None, sampler='Qelimination', samplerargs=[], addlocal=False, lsargs=[]):
+def random_circuit(pspec, length, subsetQs=None, sampler='Qelimination', samplerargs=[], addlocal=False, lsargs=[],
+                   randState=None):
     """
     Samples a random circuit of the specified length (or ~ twice this length), using layers
     independently sampled according to the specified sampling distribution.
@@ -633,6 +712,11 @@ def random_circuit(pspec, length, subsetQs=None, sampler='Qelimination', sampler
         1-element list consisting of a list of the relevant gate names (e.g., `lsargs` = ['Gi,
         'Gxpi, 'Gypi', 'Gzpi']).
 
+    randState : numpy.random.RandomState, optional
+        A RandomState object to generate samples from. If None, numpy's global random
+        state is used. If not None, this is handed to the sampler as its `randState`
+        keyword argument, so if `sampler` is a function it must accept this argument.
+
     Returns
     -------
     Circuit
@@ -651,35 +735,47 @@ def random_circuit(pspec, length, subsetQs=None, sampler='Qelimination', sampler
         elif sampler == 'local': sampler = circuit_layer_of_oneQgates
         else: raise ValueError("Sampler type not understood!")
 
+    # The qubit labels are only read, so there is no need to copy them.
     if subsetQs is not None:
         assert(isinstance(subsetQs, list) or isinstance(subsetQs, tuple)), "SubsetQs must be a list or a tuple!"
-        qubits = list(subsetQs[:])  # copy this list
+        qubits = subsetQs
     else:
-        qubits = list(pspec.qubit_labels[:])  # copy this list
+        qubits = pspec.qubit_labels
+
+    # Only hand a RandomState to the samplers if one is given, as custom samplers may not accept it.
+    if randState is None: samplerkwargs = {}
+    else: samplerkwargs = {'randState': randState}
+    localkwargs = samplerkwargs.copy()
 
-    # Initialize an empty circuit, to populate with sampled layers.
-    circuit = _cir.Circuit(layer_labels=[], line_labels=qubits, editable=True)
+    # The built-in samplers can keep the gate indices and Labels they construct in a cache, which
+    # is shared by all the layers of this circuit (and discarded with it).
+    cache = {}
+    if sampler in (circuit_layer_by_pairing_qubits, circuit_layer_by_Qelimination, circuit_layer_by_co2Qgates,
+                   circuit_layer_of_oneQgates): samplerkwargs['cache'] = cache
+    localkwargs['cache'] = cache
 
     # If we are not add layers of random local gates between the layers, sample 'length' layers
     # according to the sampler `sampler`.
     if not addlocal:
-        for i in range(0, length):
-            layer = sampler(pspec, subsetQs, *samplerargs)
-            circuit.insert_layer(layer, 0)
+        layers = [sampler(pspec, subsetQs, *samplerargs, **samplerkwargs) for i in range(0, length)]
 
     # If we are adding layers of random local gates between the layers.
     if addlocal:
+        layers = []
         for i in range(0, 2 * length + 1):
             local = not bool(i % 2)
             # For odd layers, we uniformly sample the specified type of local gates.
             if local:
-                layer = circuit_layer_of_oneQgates(pspec, subsetQs, *lsargs)
+                layer = circuit_layer_of_oneQgates(pspec, subsetQs, *lsargs, **localkwargs)
             # For even layers, we sample according to the given distribution
             else:
-                layer = sampler(pspec, subsetQs, *samplerargs)
-            circuit.insert_layer(layer, 0)
+                layer = sampler(pspec, subsetQs, *samplerargs, **samplerkwargs)
+            layers.append(layer)
 
-    circuit.done_editing()
+    # Create the (non-editable) circuit from all the sampled layers at once, rather than inserting
+    # them one at a time into an editable circuit. Each layer is placed at the start of the circuit,
+    # so the layers are in reverse order.
+    circuit = _cir.Circuit(layer_labels=layers[::-1], line_labels=qubits, editable=False)
     return circuit
 
 
@@ -981,8 +1077,8 @@ def simultaneous_random_circuits_experiment(pspec, lengths, circuits_per_length,
                         if q in subset:
                             subsetcomplement_circuit.replace_with_idling_line(q)
                     subsetcomplement_circuit.done_editing()
-                    subsetcomplement = list(_copy.copy(structure))
-                    subsetcomplement_idealout = list(_copy.copy(idealout))
+                    subsetcomplement = list(structure)
+                    subsetcomplement_idealout = list(idealout)
                     del subsetcomplement[subset_ind]
                     del subsetcomplement_idealout[subset_ind]
                     subsetcomplement = tuple(subsetcomplement)
@@ -1991,8 +2087,8 @@ def simultaneous_direct_rb_experiment(pspec, lengths, circuits_per_length, struc
                         if q in subset:
                             subsetcomplement_circuit.replace_with_idling_line(q)
                     subsetcomplement_circuit.done_editing()
-                    subsetcomplement = list(_copy.copy(structure))
-                    subsetcomplement_idealout = list(_copy.copy(idealout))
+                    subsetcomplement = list(structure)
+                    subsetcomplement_idealout = list(idealout)
                     del subsetcomplement[subset_ind]
                     del subsetcomplement_idealout[subset_ind]
                     subsetcomplement = tuple(subsetcomplement)
@@ -15,3 +15,39 @@ class KCoverageTestCase(BaseTestCase):
         k=4  # number of "labels" needing distribution
         rows = pygsti.construction.get_kcoverage_template(n,k, verbosity=2) 
         pygsti.construction.check_kcoverage_template(rows,n,k, verbosity=1) #asserts success
+
+    def test_kcoverage_cached(self):
+        rows = pygsti.construction.get_kcoverage_template(6,3)
+        rows[0][0] = -1  # modifying a returned template shouldn't affect later calls
+        rows2 = pygsti.construction.get_kcoverage_template(6,3)
+        self.assertNotEqual(rows2[0][0], -1)
+        pygsti.construction.check_kcoverage_template(rows2,6,3) #asserts success
+
+    def test_kcoverage_k1(self):
+        rows = pygsti.construction.get_kcoverage_template(4,1)
+        self.assertEqual(rows, [[0, 0, 0, 0]])
+        pygsti.construction.check_kcoverage_template(rows,4,1) #asserts success
+
+    def test_kcoverage_k3_rows(self):
+        #Regression check against previously-generated templates: for larger n, which open row a value is
+        # shifted into changes the number of rows in the template, not just their order.
+        expected_rows = [
+            '01201212021021', '02102121012012', '10210202120120', '12012020102102', '20120101210210',
+            '21021010201201', '12020120102012', '21010210201201', '02121021012021', '20101201210210',
+            '01212012021012', '10202102120120', '10221020120101', '20112010210202', '01220121021021',
+            '21002101201210', '02110212012012', '12001202102102', '21021021010201', '12012012020102',
+            '20120120101210', '02102102121012', '10210210202120', '01201201212021', '10210221010220',
+            '20120112020110', '01201220101202', '21021002121001', '02102110202101', '12012001212002',
+            '10202120120112', '20101210210221', '01212021020120', '21010201201220', '02121012010212',
+            '12020102101202', '21010212001210', '12020121002102', '20101202110201', '02121020112012',
+            '10202101220101', '01212010221001', '20112010221002', '10221020112200', '21002101220101',
+            '01220121002102', '12001202110220', '02110212001221', '21021010202120', '12012020101020',
+            '20120101212010', '02102121010211', '10210202121020', '01201212020122', '20120101210120',
+            '21021010201012', '12020120102021', '10210210202111', '12012012020110', '02102102121021',
+            '01201201212010', '20101201210202', '02102121012000', '20120101210202', '01201212021020',
+            '20120120101212', '21002101201212',
+        ]
+        rows = pygsti.construction.get_kcoverage_template(14,3)
+        self.assertEqual(rows, [[int(x) for x in row] for row in expected_rows])
+        self.assertEqual([len(pygsti.construction.get_kcoverage_template(n,3)) for n in range(15,21)],
+                         [72, 77, 81, 84, 88, 93])
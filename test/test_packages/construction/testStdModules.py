@@ -29,6 +29,15 @@ class StdModuleTestCase(BaseTestCase):
                     if gl != "Gi" and gl != ():
                         self.assertGreater(len(gl.sslbls),0)
                     
+        #Conversion is only done once, and target models are cached per parameterization (but returned as copies)
+        self.assertTrue(pygsti.construction.stdmodule_to_smqmodule(std2Q_XYICNOT) is newmod)
+        mdl1 = newmod.target_model("TP")
+        self.assertTrue(("TP", "auto") in newmod._gscache)
+        mdl2 = newmod.target_model("TP")
+        self.assertFalse(mdl1 is mdl2)
+        mdl1.set_all_parameterizations("full")
+        self.assertEqual(mdl2.num_params(), newmod.target_model("TP").num_params())
+
         #Test upgrade of 2Q dataset
         ds = pygsti.obj.DataSet(outcomeLabels=('00','01','10','11'))
         ds.get_outcome_labels()
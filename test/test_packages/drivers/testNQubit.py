@@ -10,6 +10,7 @@ from pygsti.construction import std2Q_XYICNOT
 from pygsti.objects import Label as L
 import pygsti.construction as pc
 import sys, os, warnings
+from collections import OrderedDict
 
 from ..testutils import BaseTestCase, compare_files, temp_files
 
@@ -124,7 +125,78 @@ class NQubitTestCase(BaseTestCase):
 
         self.assertEqual(set(gss.allstrs), set(compare_gss.allstrs))
 
-        
+    def test_persistent_sequence_cache(self):
+        nQubits = 1
+        maxLengths = [1,2]
+        cache_filename = temp_files + "/nqubit_1Q_seqcache.pkl"
+        if os.path.exists(cache_filename): os.remove(cache_filename)
+
+        gss = pygsti.construction.create_XYCNOT_cloudnoise_sequences(
+            nQubits, maxLengths, 'line', [], maxIdleWeight=1, maxhops=0,
+            extraWeight1Hops=0, extraGateWeight=0, verbosity=0, cache_filename=cache_filename)
+        self.assertTrue(os.path.exists(cache_filename))
+
+        cache = {}
+        gss2 = pygsti.construction.create_XYCNOT_cloudnoise_sequences(
+            nQubits, maxLengths, 'line', [], maxIdleWeight=1, maxhops=0,
+            extraWeight1Hops=0, extraGateWeight=0, verbosity=0, cache=cache, cache_filename=cache_filename)
+        self.assertTrue(1 in cache['Idle gatename fidpair lists'])  # loaded from file
+        self.assertEqual(set(gss.allstrs), set(gss2.allstrs))
+
+        #A cache saved for a different parameterization is ignored
+        cache = {}
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            pygsti.construction.create_XYCNOT_cloudnoise_sequences(
+                nQubits, [1], 'line', [], maxIdleWeight=1, maxhops=0, paramroot="H+S+A",
+                verbosity=0, cache=cache, cache_filename=cache_filename)
+            self.assertTrue(any("Ignoring cloud-noise sequence cache" in str(x.message) for x in w))
+
+
+    def test_restricted_syntheticidle_fidpairs(self):
+        #Fiducial pairs found for the weight-2 idle on 2 qubits (by create_XYCNOT_cloudnoise_sequences with
+        # maxIdleWeight=2, maxhops=1, using the "greedy" and "sequential" algorithms) are restricted to the
+        # first qubit and used for the weight-1 synthetic idles of 1Q gates.  Check that they amplify all the
+        # parameters of the synthetic-idle model, both without and with (2Q) CNOT gates in the model.
+        greedy_idle_lists = [
+            [((), ()), ((), ())], [((), ('Gx',)), ((), ('Gx',))], [((), ('Gx',)), (('Gx',), ('Gy',))],
+            [((), ('Gx',)), (('Gy',), ())], [(('Gx',), ('Gy',)), ((), ('Gx',))],
+            [(('Gx',), ('Gx',)), (('Gx',), ('Gx',))], [(('Gy',), ()), (('Gy',), ('Gx',))],
+            [(('Gy',), ('Gy',)), (('Gy',), ('Gy',))], [((), ()), (('Gx',), ('Gx',))],
+            [((), ()), (('Gy',), ('Gy',))], [(('Gx',), ('Gx',)), ((), ())],
+            [(('Gx',), ('Gx',)), (('Gy',), ('Gy',))], [(('Gy',), ('Gy',)), ((), ())],
+            [(('Gy',), ('Gy',)), (('Gx',), ('Gx',))]]
+        sequential_idle_lists = [
+            [((), ()), ((), ())], [((), ()), ((), ('Gx',))], [((), ()), ((), ('Gy',))], [((), ('Gx',)), ((), ())],
+            [((), ('Gx',)), ((), ('Gx',))], [((), ('Gx',)), ((), ('Gy',))], [((), ('Gy',)), ((), ())],
+            [((), ()), (('Gx',), ('Gx',))], [((), ()), (('Gx',), ('Gy',))], [((), ('Gx',)), (('Gx',), ())],
+            [((), ('Gx',)), (('Gx',), ('Gy',))], [((), ('Gy',)), (('Gx',), ())], [((), ()), (('Gy',), ('Gy',))],
+            [(('Gx',), ()), ((), ('Gx',))], [(('Gx',), ()), ((), ('Gy',))], [(('Gx',), ('Gx',)), ((), ())],
+            [(('Gx',), ('Gy',)), ((), ())], [(('Gx',), ()), (('Gx',), ('Gy',))],
+            [(('Gx',), ('Gx',)), (('Gx',), ('Gx',))], [(('Gx',), ('Gx',)), (('Gy',), ('Gy',))],
+            [(('Gy',), ('Gy',)), ((), ())], [(('Gy',), ('Gy',)), (('Gx',), ('Gx',))],
+            [(('Gy',), ('Gy',)), (('Gy',), ('Gy',))]]
+
+        tgt1Q = std1Q_XY.target_model("static")
+        gates1Q = [('Gx', tgt1Q.operations['Gx']), ('Gy', tgt1Q.operations['Gy'])]
+        gates2Q = gates1Q + [('Gcnot', std2Q_XYICNOT.target_model("static").operations['Gcnot'])]
+        for gatedict in (OrderedDict(gates1Q), OrderedDict(gates2Q)):
+            #Build the synthetic-idle model as create_cloudnoise_sequences does
+            sidle_model = pygsti.obj.CloudNoiseModel.build_from_hops_and_weights(
+                1, tuple(gatedict.keys()), None, gatedict, {}, None, 'line', 2, 0, 1, 0, 0, False,
+                sim_type="termorder:1", parameterization="H+S terms")
+            sidle_model._clean_paramvec()
+            idle_params = sidle_model.operation_blks['layers']['globalIdle'].gpindices
+
+            for idle_lists in (greedy_idle_lists, sequential_idle_lists):
+                restricted_lists = set([tuple(gfp_list[0:1]) for gfp_list in idle_lists])
+                fidpairs = [(pygsti.obj.Circuit([L(nm, 0) for nm in gfp_list[0][0]]),
+                             pygsti.obj.Circuit([L(nm, 0) for nm in gfp_list[0][1]]))
+                            for gfp_list in restricted_lists]
+                nAmped, nTotal = pc.test_amped_polys_for_syntheticidle(
+                    fidpairs, pygsti.obj.Circuit(((),), num_lines=1), sidle_model, wrtParams=idle_params)
+                self.assertEqual(nAmped, nTotal)
+
     def test_2Q(self):
 
         #only test when reps are fast (b/c otherwise this test is slow!)
@@ -370,7 +370,43 @@ class IDTTestCase(BaseTestCase):
         prepDict, measDict = idt.determine_paulidicts(target_model)
         self.assertEqual(prepDict, expected_prepDict)
         self.assertEqual(measDict, expected_measDict)
-        
+
+    def test_predicted_observable_rates(self):
+        nQubits = 2
+        maxLengths = [1,2,4]
+        for parameterization, affine in (("H+S", False), ("H+S+A", True)):
+            mdl_datagen = build_XYCNOT_cloudnoise_model(nQubits, "line", [], 2, 1,
+                                                        sim_type="map", parameterization=parameterization)
+            np.random.seed(1234)
+            idt.set_idle_errors(nQubits, mdl_datagen, {}, rand_default=0.001, affine=affine)
+            listOfExperiments = idt.make_idle_tomography_list(nQubits, maxLengths, (prepDict,measDict), maxweight=2,
+                                                              include_hamiltonian=True, include_stochastic=True,
+                                                              include_affine=affine)
+            ds = pygsti.construction.generate_fake_data(mdl_datagen, listOfExperiments, nSamples=100,
+                                                        sampleError='none', seed=1234)
+            idtresults = idt.do_idle_tomography(nQubits, ds, maxLengths, (prepDict,measDict), maxweight=2,
+                                                include_hamiltonian=True, include_stochastic=True,
+                                                include_affine=affine)
+            ham_intrinsic, sto_intrinsic, aff_intrinsic = idt.predicted_intrinsic_rates(nQubits, 2, mdl_datagen,
+                                                                                        True, True, affine)
+
+            for typ in ("samebasis", "diffbasis"):
+                rates = idt.predicted_observable_rates(idtresults, typ, nQubits, 2, mdl_datagen)
+                self.assertEqual(set(rates.keys()), set(idtresults.pauli_fidpairs[typ]))
+                for fidpair, dict_of_infos in zip(idtresults.pauli_fidpairs[typ], idtresults.observed_rate_infos[typ]):
+                    self.assertEqual(set(rates[fidpair].keys()), set(dict_of_infos.keys()))
+
+                    #Compare with the rates computed one jacobian row at a time
+                    for obsORoutcome, info_dict in dict_of_infos.items():
+                        if typ == "samebasis":
+                            intrinsic = np.concatenate([sto_intrinsic, aff_intrinsic]) if affine else sto_intrinsic
+                            expected = np.dot(info_dict['jacobian row'], intrinsic)
+                        else:
+                            expected = np.dot(info_dict['jacobian row'], ham_intrinsic)
+                            if affine:
+                                expected += np.dot(info_dict['affine jacobian row'], aff_intrinsic)
+                        self.assertAlmostEqual(rates[fidpair][obsORoutcome], expected, places=12)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
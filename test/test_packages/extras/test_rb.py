@@ -50,7 +50,11 @@ class RBTestCase(BaseTestCase):
         layer = rb.sample.circuit_layer_by_pairing_qubits(pspec_1, twoQprob=1.0, oneQgatenames='all', twoQgatenames='all', 
                                           modelname = 'clifford')
         self.assertEqual(len(layer), n_1//2)
-        layer = rb.sample.circuit_layer_by_pairing_qubits(pspec_1, twoQprob=0.0, oneQgatenames=['Gx',], twoQgatenames='all', 
+        layer = rb.sample.circuit_layer_by_pairing_qubits(pspec_1, subsetQs=['Q1','Q2','Q3'], twoQprob=1.0,
+                                          oneQgatenames='all', twoQgatenames='all', modelname = 'clifford')
+        self.assertEqual(len(layer), 2)
+        self.assertEqual(set([q for gate in layer for q in gate.qubits]), set(['Q1','Q2','Q3']))
+        layer = rb.sample.circuit_layer_by_pairing_qubits(pspec_1, twoQprob=0.0, oneQgatenames=['Gx',], twoQgatenames='all',
                                           modelname = 'target')
         self.assertEqual(layer[0].name, 'Gx')
     
@@ -128,6 +132,23 @@ class RBTestCase(BaseTestCase):
         self.assertEqual(circuit.depth(), 5)
         circuit = rb.sample.random_circuit(pspec_1, length=5, sampler='local',samplerargs=[['Gx']])
         self.assertEqual(circuit[0,'Q0'].name, 'Gx')
+        circuit = rb.sample.random_circuit(pspec_2, length=10, sampler='Qelimination', addlocal=True,
+                                           randState=np.random.RandomState(1234))
+        circuit2 = rb.sample.random_circuit(pspec_2, length=10, sampler='Qelimination', addlocal=True,
+                                            randState=np.random.RandomState(1234))
+        self.assertEqual(circuit, circuit2)
+
+        # Layers sampled with a cache (as random_circuit does) are the same as those sampled without one.
+        pspec_attributes = set(vars(pspec_2).keys())
+        cache = {}
+        for sampler, args in [(rb.sample.circuit_layer_by_Qelimination, [0.5]),
+                              (rb.sample.circuit_layer_by_pairing_qubits, [0.5]),
+                              (rb.sample.circuit_layer_of_oneQgates, [['Gxpi','Gh']])]:
+            for seed in range(5):
+                layer = sampler(pspec_2, [0,1,2], *args, randState=np.random.RandomState(seed))
+                layer2 = sampler(pspec_2, [0,1,2], *args, randState=np.random.RandomState(seed), cache=cache)
+                self.assertEqual(layer, layer2)
+        self.assertEqual(set(vars(pspec_2).keys()), pspec_attributes)
         
         lengths = [0,2,5]
         circuits_per_length = 2